@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:59
+
+import crm.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0003_alter_company_inn"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="company",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="companynote",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
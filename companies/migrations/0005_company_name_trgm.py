@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # pg_trgm включается миграцией триграммных индексов email
+        ("emails", "0003_emailmessage_trigram_indexes"),
+        ("companies", "0004_uuid7_primary_keys"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="company",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="company_name_trgm",
+            ),
+        ),
+    ]
@@ -1,8 +1,10 @@
-import uuid
 from decimal import Decimal
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
+from crm.utils import uuid7
 from users.models import User
 
 
@@ -11,7 +13,7 @@ class Company(models.Model):
     Модель компании.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="companies", verbose_name=_("user")
     )
@@ -89,12 +91,45 @@ class Company(models.Model):
             models.Index(fields=["user", "company_type"]),
             models.Index(fields=["user", "status"]),
             models.Index(fields=["user", "is_active"]),
+            # Триграммный индекс под icontains поиск по названию
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="company_name_trgm",
+            ),
         ]
         unique_together = ["user", "inn"]
 
     def __str__(self):
         return f"{self.name} (ИНН: {self.inn})"
 
+    # Название на момент загрузки из БД (None - неизвестно)
+    _loaded_name = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_name = instance.__dict__.get("name")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        При сохранении, если название изменилось, обновляем его в связанных
+        email.
+        """
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if (
+            not adding
+            and (update_fields is None or "name" in update_fields)
+            and self.name != self._loaded_name
+        ):
+            self.related_emails.exclude(related_company_name=self.name).update(
+                related_company_name=self.name
+            )
+        self._loaded_name = self.name
+
     @property
     def available_credit(self):
         """Доступный кредитный лимит."""
@@ -145,7 +180,7 @@ class Order(models.Model):
     Модель заказа.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     company = models.ForeignKey(
         Company,
         on_delete=models.CASCADE,
@@ -251,7 +286,7 @@ class Payment(models.Model):
     Модель платежа.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     company = models.ForeignKey(
         Company,
         on_delete=models.CASCADE,
@@ -352,7 +387,7 @@ class CompanyNote(models.Model):
     Заметки о компании.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     company = models.ForeignKey(
         Company,
         on_delete=models.CASCADE,
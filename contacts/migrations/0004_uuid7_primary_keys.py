@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:59
+
+import crm.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0003_contact_is_email_verified_contact_is_phone_verified"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contact",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contactgroup",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contactimport",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contactinteraction",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
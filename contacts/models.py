@@ -1,8 +1,10 @@
-import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
+from crm.utils import uuid7
 from users.models import User
 
 
@@ -11,7 +13,7 @@ class Contact(models.Model):
     Модель контакта пользователя.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="contacts", verbose_name=_("user")
     )
@@ -50,6 +52,15 @@ class Contact(models.Model):
             models.Index(fields=["user", "first_name", "last_name"]),
             models.Index(fields=["user", "company"]),
             models.Index(fields=["user", "is_favorite"]),
+            # Триграммные индексы под icontains поиск по имени
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="contact_first_name_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="contact_last_name_trgm",
+            ),
         ]
 
     def __str__(self):
@@ -104,7 +115,7 @@ class ContactGroup(models.Model):
     Группа контактов для организации.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -150,7 +161,7 @@ class ContactInteraction(models.Model):
         ("other", _("Other")),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     contact = models.ForeignKey(
         Contact,
         on_delete=models.CASCADE,
@@ -206,7 +217,7 @@ class ContactImport(models.Model):
         ("failed", _("Failed")),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -1,3 +1,7 @@
+import os
+import time
+import uuid
+
 from logly import logger
 
 cust_color = {"INFO": "GREEN", "ERROR": "BRIGHT_RED"}
@@ -16,3 +20,20 @@ def configure_logging():
         # auto_sink_levels=a_sink_levels,
     )
     logger.info("Настроили logger!")
+
+
+def uuid7():
+    """
+    UUID версии 7 (RFC 9562) для первичных ключей.
+
+    Старшие 48 бит - unix-время в миллисекундах, остальное - случайные
+    биты. Новые ключи растут со временем и вставляются в конец B-tree
+    индекса, а не в случайное место, как uuid4.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    # Версия 7 и вариант RFC 4122
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:42
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0003_alter_company_inn"),
+        ("emails", "0002_initial"),
+        ("projects", "0003_alter_project_inn"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddIndex(
+            model_name="emailmessage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("subject"),
+                    name="gin_trgm_ops",
+                ),
+                name="email_subject_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emailmessage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("sender"), name="gin_trgm_ops"
+                ),
+                name="email_sender_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emailmessage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("body_text"),
+                    name="gin_trgm_ops",
+                ),
+                name="email_body_trgm",
+            ),
+        ),
+    ]
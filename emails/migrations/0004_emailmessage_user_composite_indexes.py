@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0003_alter_company_inn"),
+        ("emails", "0003_emailmessage_trigram_indexes"),
+        ("projects", "0003_alter_project_inn"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailmessage",
+            index=models.Index(
+                fields=["user", "is_read"], name="emails_emai_user_id_5bf99a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emailmessage",
+            index=models.Index(
+                fields=["user", "parsed_inn"], name="emails_emai_user_id_78d57e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emailmessage",
+            index=models.Index(
+                condition=models.Q(("is_important", True)),
+                fields=["user", "received_at"],
+                name="email_user_important_idx",
+            ),
+        ),
+    ]
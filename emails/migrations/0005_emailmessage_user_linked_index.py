@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0003_alter_company_inn"),
+        ("emails", "0004_emailmessage_user_composite_indexes"),
+        ("projects", "0003_alter_project_inn"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailmessage",
+            index=models.Index(
+                condition=models.Q(("related_project__isnull", False)),
+                fields=["user", "received_at"],
+                name="email_user_linked_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:50
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_related_names(apps, schema_editor):
+    EmailMessage = apps.get_model("emails", "EmailMessage")
+    Company = apps.get_model("companies", "Company")
+    Project = apps.get_model("projects", "Project")
+
+    company_name = Company.objects.filter(pk=OuterRef("related_company_id"))
+    project_title = Project.objects.filter(pk=OuterRef("related_project_id"))
+
+    EmailMessage.objects.filter(related_company__isnull=False).update(
+        related_company_name=Subquery(company_name.values("name")[:1])
+    )
+    EmailMessage.objects.filter(related_project__isnull=False).update(
+        related_project_title=Subquery(project_title.values("title")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0003_alter_company_inn"),
+        ("emails", "0005_emailmessage_user_linked_index"),
+        ("projects", "0003_alter_project_inn"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emailmessage",
+            name="related_company_name",
+            field=models.CharField(
+                blank=True, max_length=200, verbose_name="related company name"
+            ),
+        ),
+        migrations.AddField(
+            model_name="emailmessage",
+            name="related_project_title",
+            field=models.CharField(
+                blank=True, max_length=200, verbose_name="related project title"
+            ),
+        ),
+        migrations.RunPython(fill_related_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:59
+
+import crm.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("emails", "0006_emailmessage_related_names"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emailattachment",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emailcredentials",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emailmessage",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emailprocessingrule",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emailsynclog",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
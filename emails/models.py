@@ -1,7 +1,9 @@
-import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
+from crm.utils import uuid7
 from users.models import User
 
 
@@ -10,7 +12,7 @@ class EmailCredentials(models.Model):
     Модель для хранения учетных данных Exchange.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
@@ -92,7 +94,7 @@ class EmailMessage(models.Model):
     Модель для хранения email сообщений.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="emails", verbose_name=_("user")
     )
@@ -152,6 +154,13 @@ class EmailMessage(models.Model):
         related_name="source_emails",
         verbose_name=_("related project"),
     )
+    # Денормализованные названия для списков без JOIN
+    related_company_name = models.CharField(
+        _("related company name"), max_length=200, blank=True
+    )
+    related_project_title = models.CharField(
+        _("related project title"), max_length=200, blank=True
+    )
 
     # Статус обработки
     is_processed = models.BooleanField(_("processed"), default=False)
@@ -168,6 +177,18 @@ class EmailMessage(models.Model):
         ordering = ["-received_at"]
         indexes = [
             models.Index(fields=["user", "-received_at"]),
+            models.Index(fields=["user", "is_read"]),
+            models.Index(fields=["user", "parsed_inn"]),
+            models.Index(
+                fields=["user", "received_at"],
+                condition=models.Q(is_important=True),
+                name="email_user_important_idx",
+            ),
+            models.Index(
+                fields=["user", "received_at"],
+                condition=models.Q(related_project__isnull=False),
+                name="email_user_linked_idx",
+            ),
             models.Index(fields=["credentials", "-received_at"]),
             models.Index(fields=["message_id"]),
             models.Index(fields=["sender"]),
@@ -176,11 +197,43 @@ class EmailMessage(models.Model):
             models.Index(fields=["is_processed"]),
             models.Index(fields=["related_company"]),
             models.Index(fields=["related_project"]),
+            # Триграммные индексы под icontains поиск (UPPER(col) LIKE UPPER(%s))
+            GinIndex(
+                OpClass(Upper("subject"), name="gin_trgm_ops"),
+                name="email_subject_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("sender"), name="gin_trgm_ops"),
+                name="email_sender_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("body_text"), name="gin_trgm_ops"),
+                name="email_body_trgm",
+            ),
         ]
 
     def __str__(self):
         return f"{self.subject} ({self.sender})"
 
+    def save(self, *args, **kwargs):
+        """При сохранении синхронизируем денормализованные названия связей."""
+        self._sync_related_names()
+        super().save(*args, **kwargs)
+
+    def _sync_related_names(self):
+        # Берем названия только из уже загруженных объектов - без доп. запросов
+        company_field = self._meta.get_field("related_company")
+        if self.related_company_id is None:
+            self.related_company_name = ""
+        elif company_field.is_cached(self):
+            self.related_company_name = self.related_company.name
+
+        project_field = self._meta.get_field("related_project")
+        if self.related_project_id is None:
+            self.related_project_title = ""
+        elif project_field.is_cached(self):
+            self.related_project_title = self.related_project.title
+
     @property
     def all_recipients(self):
         """Все получатели."""
@@ -194,17 +247,22 @@ class EmailMessage(models.Model):
     @property
     def body_preview(self):
         """Предварительный просмотр тела письма."""
-        if self.body_text:
-            return (
-                self.body_text[:200] + "..."
-                if len(self.body_text) > 200
-                else self.body_text
-            )
-        elif self.body_html:
+        # В списках тела писем отложены, а их начальные фрагменты
+        # аннотированы как body_text_head / body_html_head
+        body_text = getattr(self, "body_text_head", None)
+        if body_text is None:
+            body_text = self.body_text
+        body_html = getattr(self, "body_html_head", None)
+        if body_html is None:
+            body_html = self.body_html
+
+        if body_text:
+            return body_text[:200] + "..." if len(body_text) > 200 else body_text
+        elif body_html:
             # Простое извлечение текста из HTML
             import re
 
-            clean_text = re.sub(r"<[^>]+>", "", self.body_html)
+            clean_text = re.sub(r"<[^>]+>", "", body_html)
             return clean_text[:200] + "..." if len(clean_text) > 200 else clean_text
         return ""
 
@@ -214,7 +272,7 @@ class EmailAttachment(models.Model):
     Модель для вложений email.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.ForeignKey(
         EmailMessage,
         on_delete=models.CASCADE,
@@ -263,7 +321,7 @@ class EmailProcessingRule(models.Model):
     Правила обработки входящих email.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -336,7 +394,7 @@ class EmailSyncLog(models.Model):
     Лог синхронизации email.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     credentials = models.ForeignKey(
         EmailCredentials,
         on_delete=models.CASCADE,
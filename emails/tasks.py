@@ -6,7 +6,7 @@ from exchangelib import Credentials, Account, Configuration, DELEGATE
 from exchangelib.errors import ErrorNonExistentMailbox, ErrorAccessDenied
 
 from .models import EmailCredentials, EmailMessage, EmailAttachment, EmailSyncLog
-from .utils import EmailParser
+from .utils import EmailParser, invalidate_email_stats
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +159,9 @@ def sync_user_emails(self, user_id, credentials_id):
         credentials.total_emails_processed += emails_processed
         credentials.save()
 
+        # Новые письма меняют счетчики - сбрасываем кэш статистики
+        invalidate_email_stats(credentials.user_id)
+
         logger.info(
             f"Email sync completed for {credentials.email}: {emails_processed} processed"
         )
@@ -198,21 +201,23 @@ def process_email_message(self, email_id):
 
     try:
         parser = EmailParser()
+        body_text = email.body_text or ""
+        body_html = email.body_html or ""
 
         # Парсим ИНН
-        inn = parser.extract_inn(email.body_text + " " + email.body_html)
+        inn = parser.extract_inn(body_text, body_html)
         if inn:
             email.parsed_inn = inn
 
         # Парсим номер проекта
         project_number = parser.extract_project_number(
-            email.subject, email.body_text + " " + email.body_html
+            email.subject, body_text, body_html
         )
         if project_number:
             email.parsed_project_number = project_number
 
         # Парсим контакты
-        contacts = parser.extract_contacts(email.body_text + " " + email.body_html)
+        contacts = parser.extract_contacts(body_text, body_html)
         if contacts:
             email.parsed_contacts = contacts
 
@@ -250,6 +255,7 @@ def process_email_message(self, email_id):
 
         email.is_processed = True
         email.save()
+        invalidate_email_stats(email.user_id)
 
         logger.info(f"Email processed: {email.subject}")
 
@@ -301,19 +307,24 @@ def create_project_from_email(self, email_id):
         # Создаем запись в истории email проекта
         from projects.models import ProjectEmail
 
-        ProjectEmail.objects.create(
-            project=project,
-            message_id=email.message_id,
-            subject=email.subject,
-            sender=email.sender,
-            recipients=email.all_recipients,
-            body=email.body_text or email.body_html,
-            received_at=email.received_at,
-            has_attachments=email.has_attachments,
-            attachments_count=email.attachments.count(),
-            parsed_inn=email.parsed_inn,
-            parsed_project_number=email.parsed_project_number,
-            parsed_contacts=email.parsed_contacts,
+        ProjectEmail.bulk_ingest(
+            [
+                ProjectEmail(
+                    project=project,
+                    message_id=email.message_id,
+                    subject=email.subject,
+                    sender=email.sender,
+                    recipients=email.all_recipients,
+                    body=email.body_text or email.body_html,
+                    received_at=email.received_at,
+                    has_attachments=email.has_attachments,
+                    attachments_count=email.attachments.count(),
+                    parsed_inn=email.parsed_inn,
+                    parsed_project_number=email.parsed_project_number,
+                    parsed_contacts=email.parsed_contacts,
+                )
+            ],
+            move=True,
         )
 
         # Связываем email с проектом
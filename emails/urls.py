@@ -36,6 +36,12 @@ urlpatterns = [
         views.toggle_email_important_ajax,
         name="toggle_email_important_ajax",
     ),
+    path("ajax/bulk/mark-read/", views.bulk_mark_read_ajax, name="bulk_mark_read_ajax"),
+    path(
+        "ajax/bulk/toggle-important/",
+        views.bulk_toggle_important_ajax,
+        name="bulk_toggle_important_ajax",
+    ),
     path(
         "ajax/<uuid:email_id>/link-project/<uuid:project_id>/",
         views.link_email_to_project_ajax,
@@ -1,6 +1,14 @@
+import os
 import re
 import logging
-from typing import List, Dict, Optional, Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time, timedelta
+from typing import List, Dict, Optional, Any, Sequence
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
 
 log = logging.getLogger(__name__)
 
@@ -14,11 +22,24 @@ def configure_logging():
     )
 
 
+def _split_full_name(full_name: str) -> tuple[str, str]:
+    """
+    Разбивает полное имя на имя и фамилию.
+    """
+    full_name = full_name.strip()
+    name_parts = full_name.split()
+    if len(name_parts) >= 2:
+        return name_parts[0], " ".join(name_parts[1:])
+    return full_name, ""
+
+
 class EmailParser:
     """
     Утилита для парсинга email сообщений.
     """
 
+    __slots__ = ()
+
     # Регулярные выражения для поиска ИНН
     INN_PATTERNS = [
         r"\b\d{10}\b",  # 10 цифр
@@ -37,6 +58,13 @@ class EmailParser:
         r"project\s*number[:\s]*([A-Z0-9\-]+)",
     ]
 
+    # Скомпилированные варианты паттернов. Без re.ASCII: \b и \s должны
+    # понимать кириллицу и NBSP (U+00A0) так же, как при разборе по строке
+    _INN_RES = [re.compile(p, re.IGNORECASE) for p in INN_PATTERNS]
+    _PROJECT_NUMBER_RES = [
+        re.compile(p, re.IGNORECASE) for p in PROJECT_NUMBER_PATTERNS
+    ]
+
     # Регулярные выражения для поиска контактов
     CONTACT_PATTERNS = [
         r"([A-Za-zА-Яа-яЁё\s]+)\s*<([^>]+)>",  # Имя <email>
@@ -46,104 +74,125 @@ class EmailParser:
         r"phone[:\s]*([\+\d\s\-\(\)]+)",
     ]
 
-    def extract_inn(self, text: str) -> Optional[str]:
+    def extract_inn(self, *texts: str) -> Optional[str]:
         """
         Извлекает ИНН из текста.
+
+        Фрагменты письма (тема, текст, html) можно передать по отдельности -
+        они сканируются по очереди, без склейки в одну большую строку.
         """
-        if not text:
-            return None
+        texts = tuple(text for text in texts if text)
 
-        for pattern in self.INN_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                inn = match if isinstance(match, str) else match
-                if self._validate_inn(inn):
-                    return inn
+        for pattern in self._INN_RES:
+            group = 1 if pattern.groups else 0
+            for text in texts:
+                for match in pattern.finditer(text):
+                    inn = match.group(group)
+                    if self._validate_inn(inn):
+                        return inn
 
         return None
 
-    def extract_project_number(self, subject: str, body: str) -> Optional[str]:
+    def extract_project_number(self, subject: str, *bodies: str) -> Optional[str]:
         """
         Извлекает номер проекта из темы и тела письма.
         """
-        text = f"{subject} {body}"
+        # Номер проекта почти всегда указан в теме - сначала ищем в ней,
+        # и только при промахе сканируем части тела письма
+        for text in (subject, *bodies):
+            number = self._find_project_number(text)
+            if number:
+                return number
 
-        for pattern in self.PROJECT_NUMBER_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+        return None
+
+    def _find_project_number(self, text: str) -> Optional[str]:
+        """
+        Ищет номер проекта в одном фрагменте текста.
+        """
+        if not text:
+            return None
+
+        for pattern in self._PROJECT_NUMBER_RES:
+            match = pattern.search(text)
+            if match:
                 # Возвращаем первый найденный номер
-                return str(matches[0])
+                return match.group(1)
 
         return None
 
     @staticmethod
-    def extract_contacts(text: str) -> List[Dict[str, str]]:
+    def extract_contacts(*texts: str) -> List[Dict[str, str]]:
         """
-        Извлекает контактную информацию из текста.
+        Извлекает контактную информацию из текста (одного или нескольких
+        фрагментов письма, без их склейки).
         """
-        contacts = []
+        # Накапливаем поля контактов в параллельных списках и собираем
+        # словари только при возврате результата
+        out_emails: List[str] = []
+        out_first: List[str] = []
+        out_last: List[str] = []
+        out_phone: List[str] = []
 
-        # Ищем email адреса
+        texts = tuple(text for text in texts if text)
+
+        # Ищем email адреса (вместе с фрагментом, где каждый найден)
         email_pattern = r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b"
-        emails = re.findall(email_pattern, text)
+        emails = [
+            (email, text) for text in texts for email in re.findall(email_pattern, text)
+        ]
 
         # Ищем телефонные номера
         phone_pattern = r"[\+\d\s\-\(\)]{7,}"
-        phones = re.findall(phone_pattern, text)
-
-        # Ищем имена
-        name_pattern = r"\b([A-ZА-Я][a-zа-яё]+(?:\s+[A-ZА-Я][a-zа-яё]+)*)\b"
-        re.findall(name_pattern, text)
+        phones = [
+            (phone, text) for text in texts for phone in re.findall(phone_pattern, text)
+        ]
 
         # Создаем контакты на основе найденных данных
-        for email in emails:
-            contact = {"email": email}
+        for email, text in emails:
+            first_name = last_name = ""
 
             # Пытаемся найти имя для этого email
-            # Ищем паттерны типа "Имя <email>" или "Имя (email)"
+            # Ищем паттерны типа "Имя <email>" или "Имя (email)".
+            # Посессивные квантификаторы (re, Python 3.11+) исключают
+            # катастрофический возврат на длинных цепочках пробелов
             name_email_pattern = (
-                rf"([A-Za-zА-Яа-яЁё\s]+)\s*[<(]\s*{re.escape(email)}\s*[>)]"
+                r"([A-Za-zА-Яа-яЁё]++(?:\s++[A-Za-zА-Яа-яЁё]++){0,4}+)"
+                rf"\s*+[<(]\s*+{re.escape(email)}\s*+[>)]"
             )
             name_match = re.search(name_email_pattern, text, re.IGNORECASE)
             if name_match:
-                full_name = name_match.group(1).strip()
-                name_parts = full_name.split()
-                if len(name_parts) >= 2:
-                    contact["first_name"] = name_parts[0]
-                    contact["last_name"] = " ".join(name_parts[1:])
-                else:
-                    contact["first_name"] = full_name
+                first_name, last_name = _split_full_name(name_match.group(1))
 
-            contacts.append(contact)
+            out_emails.append(email)
+            out_first.append(first_name)
+            out_last.append(last_name)
+            out_phone.append("")
 
         # Добавляем контакты без email, но с телефонами
-        for phone in phones:
+        for phone, text in phones:
             phone_clean = re.sub(r"[^+\d]", "", phone)
-            if len(phone_clean) >= 7:
-                # Проверяем, не добавлен ли уже этот контакт
-                existing = next(
-                    (c for c in contacts if c.get("phone") == phone_clean), None
-                )
-                if not existing:
-                    contact = {"phone": phone_clean}
+            # Проверяем, не добавлен ли уже этот контакт
+            if len(phone_clean) >= 7 and phone_clean not in out_phone:
+                first_name = last_name = ""
 
-                    # Пытаемся найти имя для этого телефона
-                    phone_name_pattern = (
-                        rf"([A-Za-zА-Яа-яЁё\s]+)\s*[:\-]?\s*{re.escape(phone)}"
-                    )
-                    name_match = re.search(phone_name_pattern, text, re.IGNORECASE)
-                    if name_match:
-                        full_name = name_match.group(1).strip()
-                        name_parts = full_name.split()
-                        if len(name_parts) >= 2:
-                            contact["first_name"] = name_parts[0]
-                            contact["last_name"] = " ".join(name_parts[1:])
-                        else:
-                            contact["first_name"] = full_name
+                # Пытаемся найти имя для этого телефона
+                phone_name_pattern = (
+                    rf"([A-Za-zА-Яа-яЁё\s]+)\s*[:\-]?\s*{re.escape(phone)}"
+                )
+                name_match = re.search(phone_name_pattern, text, re.IGNORECASE)
+                if name_match:
+                    first_name, last_name = _split_full_name(name_match.group(1))
 
-                    contacts.append(contact)
+                out_emails.append("")
+                out_first.append(first_name)
+                out_last.append(last_name)
+                out_phone.append(phone_clean)
 
-        return contacts
+        return [
+            {"email": e, "first_name": f, "last_name": la, "phone": ph}
+            for e, f, la, ph in zip(out_emails, out_first, out_last, out_phone)
+        ]
 
     @staticmethod
     def _validate_inn(inn: str) -> bool:
@@ -187,6 +236,125 @@ class EmailParser:
         return True
 
 
+# Парсер уровня модуля: в каждом рабочем процессе создается один раз
+_PARSER = EmailParser()
+
+
+def _worker_parse(fields: tuple[str, str, str]) -> Dict[str, Any]:
+    """
+    Парсит поля письма (тема, текст, html) без обращения к БД.
+    Выполняется в рабочих процессах ProcessPoolExecutor.
+
+    Ошибка разбора одного письма не прерывает пачку: она попадает в
+    processing_errors результата, как в EmailProcessor.process_email.
+    """
+    results: Dict[str, Any] = {
+        "parsed_inn": None,
+        "parsed_project_number": None,
+        "parsed_contacts": [],
+        "processing_errors": [],
+    }
+
+    try:
+        results["parsed_inn"] = _PARSER.extract_inn(*fields)
+        results["parsed_project_number"] = _PARSER.extract_project_number(*fields)
+        results["parsed_contacts"] = _PARSER.extract_contacts(*fields)
+    except Exception as e:
+        log.error(f"Error parsing email: {e}")
+        results["processing_errors"].append(str(e))
+
+    return results
+
+
+EMAIL_STATS_CACHE_TIMEOUT = 30
+
+
+def email_stats_cache_key(user_id: Any) -> str:
+    """
+    Ключ кэша статистики email пользователя.
+    """
+    return f"email_stats:{user_id}"
+
+
+def invalidate_email_stats(user_id: Any) -> None:
+    """
+    Сбрасывает кэшированную статистику email пользователя.
+    """
+    cache.delete(email_stats_cache_key(user_id))
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """
+    Приводит значение параметра фильтра к дате (None, если не распознано).
+    """
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def start_of_day(day: date) -> datetime:
+    """
+    Начало дня в текущей временной зоне.
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def build_email_filters(params: Dict[str, Any]) -> Q:
+    """
+    Строит условие фильтрации email сообщений по разобранным параметрам
+    поиска (q, sender, has_attachments, is_important, is_read, date_from,
+    date_to, parsed_inn, related_to_project).
+    """
+    q = Q()
+
+    query = params.get("q")
+    if query:
+        q &= (
+            Q(subject__icontains=query)
+            | Q(sender__icontains=query)
+            | Q(body_text__icontains=query)
+            | Q(parsed_inn__icontains=query)
+        )
+
+    if params.get("sender"):
+        q &= Q(sender__icontains=params["sender"])
+
+    if params.get("has_attachments"):
+        q &= Q(has_attachments=True)
+
+    if params.get("is_important"):
+        q &= Q(is_important=True)
+
+    is_read = params.get("is_read")
+    if is_read == "read":
+        q &= Q(is_read=True)
+    elif is_read == "unread":
+        q &= Q(is_read=False)
+
+    # Диапазон по самому received_at (а не received_at__date), чтобы
+    # сравнение шло по индексированной колонке без DATE() на каждой строке
+    date_from = _parse_date(params.get("date_from"))
+    if date_from:
+        q &= Q(received_at__gte=start_of_day(date_from))
+
+    date_to = _parse_date(params.get("date_to"))
+    if date_to:
+        q &= Q(received_at__lt=start_of_day(date_to + timedelta(days=1)))
+
+    if params.get("parsed_inn"):
+        q &= Q(parsed_inn=params["parsed_inn"])
+
+    if params.get("related_to_project"):
+        q &= Q(related_project_id__isnull=False)
+
+    return q
+
+
 def create_contacts_from_email(email_message: Any, user: Any) -> List[Any]:
     """
     Создает контакты на основе email сообщения.
@@ -223,13 +391,22 @@ def create_contacts_from_email(email_message: Any, user: Any) -> List[Any]:
     return created_contacts
 
 
+# Порядок выбора предлагаемой компании/проекта среди совпадений: самый
+# новый (Meta.ordering), при равном created_at - по pk. Одинаков для
+# process_email и process_batch
+SUGGESTION_ORDERING = ("-created_at", "-pk")
+
+
 class EmailProcessor:
     """
     Процессор для обработки email сообщений.
     """
 
+    __slots__ = ("parser",)
+
     def __init__(self):
-        self.parser = EmailParser()
+        # Парсер не хранит состояния, поэтому используем общий экземпляр
+        self.parser = _PARSER
 
     def process_email(self, email_message: Any) -> Dict[str, Any]:
         """
@@ -245,26 +422,33 @@ class EmailProcessor:
         }
 
         try:
+            # Части письма сканируются по отдельности, без склейки в одну строку
+            fields = (
+                email_message.subject or "",
+                email_message.body_text or "",
+                email_message.body_html or "",
+            )
+
             # Парсим ИНН
-            full_text = f"{email_message.subject} {email_message.body_text} {email_message.body_html}"
-            results["parsed_inn"] = self.parser.extract_inn(full_text)
+            results["parsed_inn"] = self.parser.extract_inn(*fields)
 
             # Парсим номер проекта
             results["parsed_project_number"] = self.parser.extract_project_number(
-                email_message.subject,
-                f"{email_message.body_text} {email_message.body_html}",
+                *fields
             )
 
             # Парсим контакты
-            results["parsed_contacts"] = self.parser.extract_contacts(full_text)
+            results["parsed_contacts"] = self.parser.extract_contacts(*fields)
 
             # Предлагаем компанию на основе ИНН
             if results["parsed_inn"]:
                 from companies.models import Company
 
-                company = Company.objects.filter(
-                    inn=results["parsed_inn"], is_active=True
-                ).first()
+                company = (
+                    Company.objects.filter(inn=results["parsed_inn"], is_active=True)
+                    .order_by(*SUGGESTION_ORDERING)
+                    .first()
+                )
                 if company:
                     results["suggested_company"] = company
 
@@ -272,9 +456,14 @@ class EmailProcessor:
             if results["parsed_project_number"]:
                 from projects.models import Project
 
-                project = Project.objects.filter(
-                    project_number=results["parsed_project_number"], is_active=True
-                ).first()
+                project = (
+                    Project.objects.filter(
+                        project_number=results["parsed_project_number"],
+                        is_active=True,
+                    )
+                    .order_by(*SUGGESTION_ORDERING)
+                    .first()
+                )
                 if project:
                     results["suggested_project"] = project
 
@@ -288,6 +477,61 @@ class EmailProcessor:
 
         return results
 
+    def process_batch(
+        self, email_messages: Sequence[Any], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Обрабатывает пачку email сообщений. Парсинг выполняется параллельно
+        в пуле процессов, поиск компаний и проектов - одним запросом на пачку
+        в основном процессе.
+
+        Демоническому процессу (воркер Celery prefork) запускать дочерние
+        процессы нельзя - в нем пачка разбирается последовательно.
+        """
+        fields = [
+            (m.subject or "", m.body_text or "", m.body_html or "")
+            for m in email_messages
+        ]
+
+        if len(fields) <= 1 or multiprocessing.current_process().daemon:
+            parsed = [_worker_parse(f) for f in fields]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers or os.cpu_count()
+            ) as executor:
+                parsed = list(executor.map(_worker_parse, fields, chunksize=64))
+
+        inns = {r["parsed_inn"] for r in parsed if r["parsed_inn"]}
+        numbers = {
+            r["parsed_project_number"] for r in parsed if r["parsed_project_number"]
+        }
+
+        companies: Dict[str, Any] = {}
+        if inns:
+            from companies.models import Company
+
+            for company in Company.objects.filter(
+                inn__in=inns, is_active=True
+            ).order_by(*SUGGESTION_ORDERING):
+                companies.setdefault(company.inn, company)
+
+        projects: Dict[str, Any] = {}
+        if numbers:
+            from projects.models import Project
+
+            for project in Project.objects.filter(
+                project_number__in=numbers, is_active=True
+            ).order_by(*SUGGESTION_ORDERING):
+                projects.setdefault(project.project_number, project)
+
+        results = []
+        for r in parsed:
+            r["suggested_company"] = companies.get(r["parsed_inn"])
+            r["suggested_project"] = projects.get(r["parsed_project_number"])
+            results.append(r)
+
+        return results
+
     @staticmethod
     def create_project_from_email(email_message: Any, user: Any) -> Optional[Any]:
         """
@@ -1,11 +1,18 @@
 import json
+import uuid
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import Left
 from django.http import JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse_lazy
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_POST
 from django.views.generic import (
@@ -16,12 +23,16 @@ from django.views.generic import (
     DeleteView,
     TemplateView,
 )
+from exchangelib import Credentials, Account, Configuration, DELEGATE
 from rest_framework import status
 from rest_framework.decorators import api_view
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from companies.models import Company
+from projects.models import Project, ProjectEmail
 from users.permissions import RBACPermission, check_user_permission
 from .forms import (
     EmailCredentialsForm,
@@ -32,11 +43,143 @@ from .forms import (
 )
 from .models import EmailCredentials, EmailMessage, EmailProcessingRule, EmailSyncLog
 from .tasks import sync_user_emails, process_email_message
-from .utils import EmailProcessor, configure_logging, log
+from .utils import (
+    EMAIL_STATS_CACHE_TIMEOUT,
+    EmailProcessor,
+    build_email_filters,
+    configure_logging,
+    email_stats_cache_key,
+    invalidate_email_stats,
+    log,
+    start_of_day,
+)
 
 
 configure_logging()
 
+# GET-параметры фильтрации списка email
+EMAIL_FILTER_PARAMS = (
+    "q",
+    "sender",
+    "has_attachments",
+    "is_important",
+    "is_read",
+    "date_from",
+    "date_to",
+    "parsed_inn",
+    "related_to_project",
+)
+
+
+def has_email_filters(params):
+    """
+    Проверяет, передан ли хотя бы один параметр фильтрации.
+    """
+    return any(params.get(key) for key in EMAIL_FILTER_PARAMS)
+
+
+def get_email_stats(user):
+    """
+    Статистика email пользователя. Список писем и AJAX-опрос дашборда
+    читают один и тот же кэш, поэтому агрегат выполняется не на каждый запрос.
+    """
+    return cache.get_or_set(
+        email_stats_cache_key(user.id),
+        lambda: _compute_email_stats(user),
+        EMAIL_STATS_CACHE_TIMEOUT,
+    )
+
+
+def _compute_email_stats(user):
+    """
+    Статистика email пользователя одним агрегирующим запросом.
+
+    Письма за сегодня отбираются диапазоном от начала текущего дня, чтобы
+    условие использовало индекс по received_at.
+    """
+    return EmailMessage.objects.filter(user=user).aggregate(
+        total_emails=Count("id"),
+        unread_emails=Count("id", filter=Q(is_read=False)),
+        important_emails=Count("id", filter=Q(is_important=True)),
+        emails_with_attachments=Count("id", filter=Q(has_attachments=True)),
+        parsed_inn_count=Count("id", filter=Q(parsed_inn__isnull=False)),
+        related_to_projects=Count("id", filter=Q(related_project_id__isnull=False)),
+        today_emails=Count(
+            "id", filter=Q(received_at__gte=start_of_day(timezone.localdate()))
+        ),
+    )
+
+
+class CappedCountPage(Page):
+    """
+    Страница CappedCountPaginator. Если подсчет уперся в лимит, наличие
+    следующей страницы определяется по лишней строке выборки (has_more).
+    """
+
+    has_more = None
+
+    def has_next(self):
+        if self.has_more is None:
+            return super().has_next()
+        return self.has_more
+
+    def end_index(self):
+        if self.has_more is None:
+            return super().end_index()
+        return self.start_index() + len(self) - 1
+
+
+class CappedCountPaginator(Paginator):
+    """
+    Пагинатор с ограниченным подсчетом: COUNT(*) считает не больше
+    max_count строк и без сортировки, вместо полного повторного прохода
+    по отфильтрованной выборке.
+
+    Если строк не меньше max_count (count_capped), count и num_pages -
+    нижняя граница (шаблон выводит "N+"), а страницы за лимитом остаются
+    доступны: каждая выбирается с одной лишней строкой, по которой
+    видно, есть ли следующая.
+    """
+
+    max_count = 10000
+
+    @cached_property
+    def count(self):
+        return self.object_list.values("pk").order_by()[: self.max_count].count()
+
+    @cached_property
+    def count_capped(self):
+        """
+        Подсчет уперся в max_count: строк может быть больше.
+        """
+        return self.count >= self.max_count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # Номер за num_pages допустим, если подсчет был ограничен;
+            # пустую страницу отсекает page()
+            if not self.count_capped or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_capped:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows:
+            raise EmptyPage(self.error_messages["no_results"])
+        page = self._get_page(rows[: self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return CappedCountPage(*args, **kwargs)
+
 
 class EmailCredentialsView(LoginRequiredMixin, TemplateView):
     """
@@ -45,13 +188,21 @@ class EmailCredentialsView(LoginRequiredMixin, TemplateView):
 
     template_name = "emails/credentials.html"
 
+    def get_credentials(self):
+        """
+        Возвращает учетные данные пользователя. Если их еще нет, возвращает
+        несохраненный экземпляр: запись создается только при сохранении формы.
+        """
+        user = self.request.user
+        try:
+            return EmailCredentials.objects.get(user=user), False
+        except EmailCredentials.DoesNotExist:
+            return EmailCredentials(user=user, email=user.email), True
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Получаем или создаем учетные данные пользователя
-        credentials, created = EmailCredentials.objects.get_or_create(
-            user=self.request.user, defaults={"email": self.request.user.email}
-        )
+        credentials, created = self.get_credentials()
         log.info(f"get_context_data -> credentials: {credentials}, created: {created}")
         context["credentials"] = credentials
         context["credentials_form"] = EmailCredentialsForm(
@@ -60,19 +211,20 @@ class EmailCredentialsView(LoginRequiredMixin, TemplateView):
         context["test_form"] = EmailTestConnectionForm()
         context["import_form"] = EmailImportForm()
 
-        # Логи синхронизации
-        context["sync_logs"] = EmailSyncLog.objects.filter(
-            credentials=credentials
-        ).order_by("-started_at")[:10]
+        # Логи синхронизации (у новых учетных данных их нет)
+        context["sync_logs"] = (
+            EmailSyncLog.objects.none()
+            if created
+            else EmailSyncLog.objects.filter(credentials=credentials).order_by(
+                "-started_at"
+            )[:10]
+        )
 
         return context
 
     def post(self, request, *args, **kwargs):
-        formcredentials, created = EmailCredentials.objects.get_or_create(
-            user=request.user, defaults={"email": request.user.email}
-        )
-
         if "save_credentials" in request.POST:
+            formcredentials, created = self.get_credentials()
             log.info(
                 f"save_credentials -> formcredentials: {formcredentials}, created: {created}"
             )
@@ -96,13 +248,6 @@ class EmailCredentialsView(LoginRequiredMixin, TemplateView):
                 log.info("test_connection -> Сохраняем данные:")
                 # Тестируем подключение
                 try:
-                    from exchangelib import (
-                        Credentials,
-                        Account,
-                        Configuration,
-                        DELEGATE,
-                    )
-
                     log.info(f"test_connection -> Email: {form.cleaned_data['email']}")
                     log.info(
                         f"test_connection -> Password: {form.cleaned_data['password']}"
@@ -153,56 +298,44 @@ class EmailMessageListView(LoginRequiredMixin, ListView):
     template_name = "emails/email_list.html"
     context_object_name = "emails"
     paginate_by = 50
+    paginator_class = CappedCountPaginator
+
+    # Поля, которые выводит шаблон списка; тела писем не загружаются
+    list_fields = (
+        "id",
+        "subject",
+        "sender",
+        "recipients_to",
+        "received_at",
+        "is_read",
+        "is_important",
+        "has_attachments",
+        "parsed_inn",
+        "related_company",
+        "related_company_name",
+        "related_project",
+        "related_project_title",
+    )
 
     def get_queryset(self):
-        queryset = EmailMessage.objects.filter(user=self.request.user).select_related(
-            "related_company", "related_project"
-        )
-
-        # Поиск
-        search_query = self.request.GET.get("q", "")
-        if search_query:
-            queryset = queryset.filter(
-                Q(subject__icontains=search_query)
-                | Q(sender__icontains=search_query)
-                | Q(body_text__icontains=search_query)
-                | Q(parsed_inn__icontains=search_query)
+        queryset = (
+            EmailMessage.objects.filter(user=self.request.user)
+            # Названия компании/проекта денормализованы - без JOIN и prefetch
+            .only(*self.list_fields)
+            # Начальные фрагменты тела для body_preview
+            .annotate(
+                body_text_head=Left("body_text", 201),
+                body_html_head=Left("body_html", 2000),
             )
+        )
 
-        # Фильтры
-        sender = self.request.GET.get("sender", "")
-        if sender:
-            queryset = queryset.filter(sender__icontains=sender)
-
-        has_attachments = self.request.GET.get("has_attachments")
-        if has_attachments:
-            queryset = queryset.filter(has_attachments=True)
-
-        is_important = self.request.GET.get("is_important")
-        if is_important:
-            queryset = queryset.filter(is_important=True)
-
-        is_read = self.request.GET.get("is_read")
-        if is_read == "read":
-            queryset = queryset.filter(is_read=True)
-        elif is_read == "unread":
-            queryset = queryset.filter(is_read=False)
-
-        date_from = self.request.GET.get("date_from")
-        if date_from:
-            queryset = queryset.filter(received_at__date__gte=date_from)
-
-        date_to = self.request.GET.get("date_to")
-        if date_to:
-            queryset = queryset.filter(received_at__date__lte=date_to)
-
-        parsed_inn = self.request.GET.get("parsed_inn")
-        if parsed_inn:
-            queryset = queryset.filter(parsed_inn=parsed_inn)
+        # Без фильтров - сразу последние письма
+        if not has_email_filters(self.request.GET):
+            return queryset.order_by("-received_at")
 
-        related_to_project = self.request.GET.get("related_to_project")
-        if related_to_project:
-            queryset = queryset.exclude(related_project__isnull=True)
+        # Непустой параметр включает фильтр
+        params = {key: self.request.GET.get(key) for key in EMAIL_FILTER_PARAMS}
+        queryset = queryset.filter(build_email_filters(params))
 
         return queryset.order_by("-received_at")
 
@@ -211,15 +344,7 @@ class EmailMessageListView(LoginRequiredMixin, ListView):
         context["search_form"] = EmailSearchForm(data=self.request.GET)
 
         # Статистика
-        emails = EmailMessage.objects.filter(user=self.request.user)
-        context["stats"] = {
-            "total_emails": emails.count(),
-            "unread_emails": emails.filter(is_read=False).count(),
-            "important_emails": emails.filter(is_important=True).count(),
-            "emails_with_attachments": emails.filter(has_attachments=True).count(),
-            "parsed_inn_count": emails.exclude(parsed_inn__isnull=True).count(),
-            "related_to_projects": emails.exclude(related_project__isnull=True).count(),
-        }
+        context["stats"] = get_email_stats(self.request.user)
 
         return context
 
@@ -242,20 +367,22 @@ class EmailMessageDetailView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        email = self.get_object()
+        # Объект уже загружен в get(); повторный get_object() - лишний запрос
+        email = self.object
 
         # Помечаем как прочитанное
         if not email.is_read:
+            EmailMessage.objects.filter(pk=email.pk).update(
+                is_read=True, updated_at=timezone.now()
+            )
             email.is_read = True
-            email.save()
+            invalidate_email_stats(self.request.user.id)
 
         # Получаем связанные проекты и компании
         context["related_projects"] = []
         context["related_companies"] = []
 
         if email.parsed_inn:
-            from companies.models import Company
-            from projects.models import Project
 
             context["related_companies"] = Company.objects.filter(
                 user=self.request.user, inn=email.parsed_inn, is_active=True
@@ -335,77 +462,56 @@ def email_search_ajax(request):
     """
     AJAX поиск email сообщений.
     """
-    query = request.GET.get("q", "")
-    sender = request.GET.get("sender", "")
-    has_attachments = request.GET.get("has_attachments", "").lower() == "true"
-    is_important = request.GET.get("is_important", "").lower() == "true"
-    is_read = request.GET.get("is_read", "")
-    date_from = request.GET.get("date_from", "")
-    date_to = request.GET.get("date_to", "")
-    parsed_inn = request.GET.get("parsed_inn", "")
-    related_to_project = request.GET.get("related_to_project", "").lower() == "true"
-
-    emails = EmailMessage.objects.filter(user=request.user).select_related(
-        "related_company", "related_project"
-    )
-
-    if query:
-        emails = emails.filter(
-            Q(subject__icontains=query)
-            | Q(sender__icontains=query)
-            | Q(body_text__icontains=query)
-            | Q(parsed_inn__icontains=query)
-        )
-
-    if sender:
-        emails = emails.filter(sender__icontains=sender)
-
-    if has_attachments:
-        emails = emails.filter(has_attachments=True)
-
-    if is_important:
-        emails = emails.filter(is_important=True)
-
-    if is_read == "read":
-        emails = emails.filter(is_read=True)
-    elif is_read == "unread":
-        emails = emails.filter(is_read=False)
-
-    if date_from:
-        emails = emails.filter(received_at__date__gte=date_from)
-
-    if date_to:
-        emails = emails.filter(received_at__date__lte=date_to)
-
-    if parsed_inn:
-        emails = emails.filter(parsed_inn=parsed_inn)
-
-    if related_to_project:
-        emails = emails.exclude(related_project__isnull=True)
+    emails = EmailMessage.objects.filter(user=request.user)
 
-    emails = emails[:100]  # Ограничение результатов
+    # Без фильтров пропускаем разбор параметров
+    if has_email_filters(request.GET):
+        params = {key: request.GET.get(key, "") for key in EMAIL_FILTER_PARAMS}
+        # Флаги в AJAX запросе передаются как "true"/"false"
+        for key in ("has_attachments", "is_important", "related_to_project"):
+            params[key] = params[key].lower() == "true"
+        emails = emails.filter(build_email_filters(params))
+
+    # Ограничение результатов; названия связей денормализованы,
+    # values() не создает экземпляров моделей
+    emails = emails.values(
+        "id",
+        "subject",
+        "sender",
+        "received_at",
+        "is_read",
+        "is_important",
+        "has_attachments",
+        "parsed_inn",
+        "related_company_id",
+        "related_company_name",
+        "related_project_id",
+        "related_project_title",
+    )[:100]
 
     data = [
         {
-            "id": str(email.id),
-            "subject": email.subject,
-            "sender": email.sender,
-            "received_at": email.received_at.strftime("%d.%m.%Y %H:%M"),
-            "is_read": email.is_read,
-            "is_important": email.is_important,
-            "has_attachments": email.has_attachments,
-            "parsed_inn": email.parsed_inn or "",
+            "id": str(email["id"]),
+            "subject": email["subject"],
+            "sender": email["sender"],
+            "received_at": email["received_at"].strftime("%d.%m.%Y %H:%M"),
+            "is_read": email["is_read"],
+            "is_important": email["is_important"],
+            "has_attachments": email["has_attachments"],
+            "parsed_inn": email["parsed_inn"] or "",
+            # Название актуально, пока связь не обнулена (SET_NULL)
             "related_company": (
-                email.related_company.name if email.related_company else ""
+                email["related_company_name"] if email["related_company_id"] else ""
             ),
             "related_project": (
-                email.related_project.title if email.related_project else ""
+                email["related_project_title"] if email["related_project_id"] else ""
             ),
         }
         for email in emails
     ]
 
-    return JsonResponse({"emails": data})
+    # Компактные разделители уменьшают размер ответа
+    return JsonResponse({"emails": data}, json_dumps_params={"separators": (",", ":")})
 
 
 @login_required
@@ -415,11 +521,14 @@ def mark_email_read_ajax(request, email_id):
     AJAX пометка email как прочитанного/непрочитанного.
     """
     try:
-        email = EmailMessage.objects.get(id=email_id, user=request.user)
-        email.is_read = not email.is_read
-        email.save()
+        emails = EmailMessage.objects.filter(id=email_id, user=request.user)
+        # Атомарное переключение флага без перезаписи всех колонок
+        if not emails.update(is_read=~F("is_read"), updated_at=timezone.now()):
+            raise EmailMessage.DoesNotExist
+        is_read = emails.values_list("is_read", flat=True).get()
+        invalidate_email_stats(request.user.id)
 
-        return JsonResponse({"success": True, "is_read": email.is_read})
+        return JsonResponse({"success": True, "is_read": is_read})
 
     except EmailMessage.DoesNotExist:
         return JsonResponse({"success": False, "error": "Email not found"})
@@ -432,57 +541,137 @@ def toggle_email_important_ajax(request, email_id):
     AJAX переключение важности email.
     """
     try:
-        email = EmailMessage.objects.get(id=email_id, user=request.user)
-        email.is_important = not email.is_important
-        email.save()
+        emails = EmailMessage.objects.filter(id=email_id, user=request.user)
+        # Атомарное переключение флага без перезаписи всех колонок
+        if not emails.update(
+            is_important=~F("is_important"), updated_at=timezone.now()
+        ):
+            raise EmailMessage.DoesNotExist
+        is_important = emails.values_list("is_important", flat=True).get()
+        invalidate_email_stats(request.user.id)
 
-        return JsonResponse({"success": True, "is_important": email.is_important})
+        return JsonResponse({"success": True, "is_important": is_important})
 
     except EmailMessage.DoesNotExist:
         return JsonResponse({"success": False, "error": "Email not found"})
 
 
+def _get_bulk_email_ids(request):
+    """
+    Список id писем из тела запроса ({"ids": [...]} или ids=...&ids=...).
+    Возвращает None, если список не передан или содержит некорректные id.
+    """
+    try:
+        if request.content_type == "application/json":
+            ids = json.loads(request.body).get("ids")
+        else:
+            ids = request.POST.getlist("ids")
+        return [uuid.UUID(str(email_id)) for email_id in ids] or None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+@login_required
+@require_POST
+def bulk_mark_read_ajax(request):
+    """
+    AJAX пометка нескольких email как прочитанных одним UPDATE.
+    """
+    ids = _get_bulk_email_ids(request)
+    if ids is None:
+        return JsonResponse({"success": False, "error": "No email ids"})
+
+    updated = EmailMessage.objects.filter(
+        user=request.user, id__in=ids, is_read=False
+    ).update(is_read=True, updated_at=timezone.now())
+    if updated:
+        invalidate_email_stats(request.user.id)
+
+    return JsonResponse({"success": True, "updated": updated})
+
+
+@login_required
+@require_POST
+def bulk_toggle_important_ajax(request):
+    """
+    AJAX переключение важности нескольких email одним UPDATE.
+    """
+    ids = _get_bulk_email_ids(request)
+    if ids is None:
+        return JsonResponse({"success": False, "error": "No email ids"})
+
+    updated = EmailMessage.objects.filter(user=request.user, id__in=ids).update(
+        is_important=~F("is_important"), updated_at=timezone.now()
+    )
+    if updated:
+        invalidate_email_stats(request.user.id)
+
+    return JsonResponse({"success": True, "updated": updated})
+
+
 @login_required
 @require_POST
 def link_email_to_project_ajax(request, email_id, project_id):
     """
     AJAX привязка email к проекту.
     """
-    try:
-        email = EmailMessage.objects.get(id=email_id, user=request.user)
-        from projects.models import Project
-
-        project = Project.objects.get(id=project_id, user=request.user, is_active=True)
-
-        email.related_project = project
-        email.save()
-
-        # Создаем запись в истории проекта
-        from projects.models import ProjectEmail
-
-        ProjectEmail.objects.get_or_create(
-            project=project,
-            message_id=email.message_id,
-            defaults={
-                "subject": email.subject,
-                "sender": email.sender,
-                "recipients": email.all_recipients,
-                "body": email.body_text or email.body_html,
-                "received_at": email.received_at,
-                "has_attachments": email.has_attachments,
-                "attachments_count": email.attachments.count(),
-                "parsed_inn": email.parsed_inn,
-                "parsed_project_number": email.parsed_project_number,
-                "parsed_contacts": email.parsed_contacts,
-            },
+    # Количество вложений получаем тем же запросом
+    email = (
+        EmailMessage.objects.annotate(attachments_total=Count("attachments"))
+        .filter(id=email_id, user=request.user)
+        .first()
+    )
+    if email is None:
+        return JsonResponse({"success": False, "error": "Email not found"})
+
+    project = (
+        Project.objects.filter(id=project_id, user=request.user, is_active=True)
+        .only("id", "title", "user")
+        .first()
+    )
+    if project is None:
+        return JsonResponse({"success": False, "error": "Project not found"})
+
+    with transaction.atomic():
+        # Привязываем email; 0 обновленных строк - email уже привязан к
+        # проекту
+        linked = (
+            EmailMessage.objects.filter(pk=email.pk)
+            .exclude(related_project=project)
+            .update(
+                related_project=project,
+                related_project_title=project.title,
+                updated_at=timezone.now(),
+            )
+        )
+
+        # Запись в истории проекта создается и для уже привязанного email
+        # (ON CONFLICT DO NOTHING по уникальному message_id вместо
+        # SELECT + INSERT); запись прежнего проекта письма переносится
+        ProjectEmail.bulk_ingest(
+            [
+                ProjectEmail(
+                    project=project,
+                    message_id=email.message_id,
+                    subject=email.subject,
+                    sender=email.sender,
+                    recipients=email.all_recipients,
+                    body=email.body_text or email.body_html,
+                    received_at=email.received_at,
+                    has_attachments=email.has_attachments,
+                    attachments_count=email.attachments_total,
+                    parsed_inn=email.parsed_inn,
+                    parsed_project_number=email.parsed_project_number,
+                    parsed_contacts=email.parsed_contacts,
+                )
+            ],
+            move=True,
         )
 
-        return JsonResponse({"success": True, "project_title": project.title})
+    if linked:
+        invalidate_email_stats(request.user.id)
 
-    except EmailMessage.DoesNotExist:
-        return JsonResponse({"success": False, "error": "Email not found"})
-    except Project.DoesNotExist:
-        return JsonResponse({"success": False, "error": "Project not found"})
+    return JsonResponse({"success": True, "project_title": project.title})
 
 
 @login_required
@@ -510,24 +699,20 @@ def get_email_stats_ajax(request):
     """
     AJAX получение статистики email.
     """
-    emails = EmailMessage.objects.filter(user=request.user)
+    return JsonResponse({"stats": get_email_stats(request.user)})
 
-    stats = {
-        "total_emails": emails.count(),
-        "unread_emails": emails.filter(is_read=False).count(),
-        "important_emails": emails.filter(is_important=True).count(),
-        "emails_with_attachments": emails.filter(has_attachments=True).count(),
-        "parsed_inn_count": emails.exclude(parsed_inn__isnull=True).count(),
-        "related_to_projects": emails.exclude(related_project__isnull=True).count(),
-        "today_emails": emails.filter(
-            received_at__date=request.user.date_joined.date()
-        ).count(),
-    }
 
-    return JsonResponse({"stats": stats})
+# API Views
 
 
-# API Views
+class EmailAPIPagination(PageNumberPagination):
+    """
+    Постраничная выдача email сообщений в API.
+    """
+
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
 
 
 class EmailAPIView(APIView):
@@ -537,49 +722,72 @@ class EmailAPIView(APIView):
 
     permission_classes = [IsAuthenticated, RBACPermission]
     required_permissions = ["view_project"]  # Используем project permissions для email
-
-    @staticmethod
-    def get(request):
-        """Получить список email сообщений пользователя."""
-        emails = EmailMessage.objects.filter(user=request.user).select_related(
-            "related_company", "related_project"
+    pagination_class = EmailAPIPagination
+
+    def get(self, request):
+        """Получить список email сообщений пользователя (постранично)."""
+        emails = (
+            EmailMessage.objects.filter(user=request.user)
+            .order_by("-received_at")
+            .values(
+                "id",
+                "message_id",
+                "subject",
+                "sender",
+                "recipients_to",
+                "received_at",
+                "is_read",
+                "is_important",
+                "has_attachments",
+                "parsed_inn",
+                "parsed_project_number",
+                "related_company__id",
+                "related_company__name",
+                "related_company__inn",
+                "related_project__id",
+                "related_project__title",
+            )
         )
 
+        # Без пагинации список материализовался целиком в памяти
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(emails, request, view=self)
+
         data = [
             {
-                "id": str(email.id),
-                "message_id": email.message_id,
-                "subject": email.subject,
-                "sender": email.sender,
-                "recipients_to": email.recipients_to,
-                "received_at": email.received_at.isoformat(),
-                "is_read": email.is_read,
-                "is_important": email.is_important,
-                "has_attachments": email.has_attachments,
-                "parsed_inn": email.parsed_inn,
-                "parsed_project_number": email.parsed_project_number,
+                "id": str(email["id"]),
+                "message_id": email["message_id"],
+                "subject": email["subject"],
+                "sender": email["sender"],
+                "recipients_to": email["recipients_to"],
+                "received_at": email["received_at"].isoformat(),
+                "is_read": email["is_read"],
+                "is_important": email["is_important"],
+                "has_attachments": email["has_attachments"],
+                "parsed_inn": email["parsed_inn"],
+                "parsed_project_number": email["parsed_project_number"],
                 "related_company": (
                     {
-                        "id": str(email.related_company.id),
-                        "name": email.related_company.name,
-                        "inn": email.related_company.inn,
+                        "id": str(email["related_company__id"]),
+                        "name": email["related_company__name"],
+                        "inn": email["related_company__inn"],
                     }
-                    if email.related_company
+                    if email["related_company__id"]
                     else None
                 ),
                 "related_project": (
                     {
-                        "id": str(email.related_project.id),
-                        "title": email.related_project.title,
+                        "id": str(email["related_project__id"]),
+                        "title": email["related_project__title"],
                     }
-                    if email.related_project
+                    if email["related_project__id"]
                     else None
                 ),
             }
-            for email in emails
+            for email in page
         ]
 
-        return Response(data)
+        return paginator.get_paginated_response(data)
 
 
 class EmailSyncAPIView(APIView):
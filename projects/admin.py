@@ -1,9 +1,17 @@
 from django.contrib import admin
-from django.db.models import Count
+from django.core.cache import cache
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 
-from .models import Project
+from .models import (
+    Project,
+    ProjectAttachment,
+    ProjectEmail,
+    ProjectNote,
+    ProjectStatusHistory,
+)
 
 
 @admin.register(Project)
@@ -26,6 +34,7 @@ class ProjectAdmin(admin.ModelAdmin):
     search_fields = ("title", "description", "inn", "user__email")
     readonly_fields = ("id", "created_at", "updated_at")
     ordering = ("-created_at",)
+    list_select_related = ("user",)
 
     fieldsets = (
         (None, {"fields": ("title", "description", "status", "priority")}),
@@ -65,12 +74,21 @@ class ProjectAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         """Оптимизировать запросы с аннотациями."""
+        # Коррелированный подзапрос вместо JOIN + GROUP BY по всем колонкам
+        emails_count = (
+            ProjectEmail.objects.filter(project=OuterRef("pk"))
+            .order_by()
+            .values("project")
+            .annotate(c=Count("*"))
+            .values("c")
+        )
         return (
             super()
             .get_queryset(request)
-            .select_related("user")
             .annotate(
-                emails_count=Count("emails"),
+                emails_count=Coalesce(
+                    Subquery(emails_count, output_field=IntegerField()), 0
+                ),
             )
         )
 
@@ -92,10 +110,23 @@ class ProjectAdmin(admin.ModelAdmin):
         return response
 
     def get_project_stats(self):
-        """Получить статистику проектов."""
-        total = Project.objects.count()
-        active = Project.objects.filter(is_active=True).count()
-        completed = Project.objects.filter(status="completed").count()
+        """Получить статистику проектов (кэшируется на 30 секунд)."""
+        return cache.get_or_set("project_stats_global", self._compute_project_stats, 30)
+
+    @staticmethod
+    def _compute_project_stats():
+        """Посчитать статистику проектов."""
+        # Счетчики одним агрегирующим запросом
+        counts = Project.objects.aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(is_active=True)),
+            completed=Count("id", filter=Q(status="completed")),
+            with_inn=Count("id", filter=Q(inn__isnull=False) & ~Q(inn="")),
+        )
+        total = counts["total"]
+        active = counts["active"]
+        completed = counts["completed"]
+        with_inn = counts["with_inn"]
 
         # Статистика по статусам
         status_stats = (
@@ -111,9 +142,6 @@ class ProjectAdmin(admin.ModelAdmin):
             .order_by("-count")
         )
 
-        # Проекты с ИНН
-        with_inn = Project.objects.exclude(inn__isnull=True).exclude(inn="").count()
-
         return {
             "total": total,
             "active": active,
@@ -125,3 +153,50 @@ class ProjectAdmin(admin.ModelAdmin):
             "status_distribution": list(status_stats),
             "priority_distribution": list(priority_stats),
         }
+
+
+@admin.register(ProjectNote)
+class ProjectNoteAdmin(admin.ModelAdmin):
+    """
+    Админка для заметок проектов.
+    """
+
+    list_display = ("__str__", "user", "note_type", "is_important", "created_at")
+    list_filter = ("note_type", "is_important", "is_private", "created_at")
+    search_fields = ("title", "content", "project__title")
+    readonly_fields = ("id", "created_at", "updated_at")
+    ordering = ("-created_at",)
+    # __str__ читает project.title - без JOIN это запрос на каждую строку
+    list_select_related = ("project", "user")
+    raw_id_fields = ("project", "user")
+
+
+@admin.register(ProjectStatusHistory)
+class ProjectStatusHistoryAdmin(admin.ModelAdmin):
+    """
+    Админка для истории статусов проектов.
+    """
+
+    list_display = ("__str__", "user", "changed_at")
+    list_filter = ("old_status", "new_status", "changed_at")
+    search_fields = ("project__title", "reason")
+    readonly_fields = ("id", "changed_at")
+    ordering = ("-changed_at",)
+    list_select_related = ("project", "user")
+    raw_id_fields = ("project", "user")
+
+
+@admin.register(ProjectAttachment)
+class ProjectAttachmentAdmin(admin.ModelAdmin):
+    """
+    Админка для вложений проектов.
+    """
+
+    list_display = ("__str__", "content_type", "size", "is_downloaded", "created_at")
+    list_filter = ("is_downloaded", "content_type", "created_at")
+    search_fields = ("filename", "project_email__subject")
+    readonly_fields = ("id", "created_at")
+    ordering = ("-created_at",)
+    # __str__ читает project_email.subject
+    list_select_related = ("project_email",)
+    raw_id_fields = ("project_email",)
@@ -1,7 +1,39 @@
+import re
+
 from django import forms
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from .models import Project, ProjectNote
+from companies.models import Company
+from contacts.models import Contact
+
+from .models import Project, ProjectNote, ProjectStatusHistory
+from .utils import invalidate_project_search, invalidate_project_stats
+
+
+# Разделители тегов: запятая (в т.ч. полноширинная) и точка с запятой
+_TAG_SPLIT_RE = re.compile(r"[,\uFF0C;]+")
+
+
+def set_user_choices(field, model, user):
+    """
+    Ограничивает поле выбора активными объектами пользователя.
+
+    Готовый список вариантов кэшируется на объекте пользователя, поэтому
+    несколько форм в одном запросе (поиск + создание) читают его один раз.
+    """
+    field.queryset = model.objects.filter(user=user, is_active=True)
+
+    choices_cache = getattr(user, "_form_choices_cache", None)
+    if choices_cache is None:
+        choices_cache = user._form_choices_cache = {}
+
+    key = model._meta.label
+    if key not in choices_cache:
+        # iter(): без лишнего COUNT(*) от __len__ итератора
+        choices_cache[key] = list(iter(field.choices))
+    field.choices = choices_cache[key]
 
 
 class ProjectForm(forms.ModelForm):
@@ -69,20 +101,19 @@ class ProjectForm(forms.ModelForm):
 
         # Фильтруем компании и контакты по пользователю
         if self.user:
-            from companies.models import Company
-            from contacts.models import Contact
-
-            self.fields["company"].queryset = Company.objects.filter(
-                user=self.user, is_active=True
-            )
-            self.fields["contact"].queryset = Contact.objects.filter(
-                user=self.user, is_active=True
-            )
+            set_user_choices(self.fields["company"], Company, self.user)
+            set_user_choices(self.fields["contact"], Contact, self.user)
 
         # Если редактируем существующий проект, заполняем поле tags_input
         if self.instance and self.instance.pk:
             self.fields["tags_input"].initial = ", ".join(self.instance.tags)
 
+    def clean_tags_input(self):
+        """Разбор тегов в список без пустых значений и повторов."""
+        raw = self.cleaned_data.get("tags_input", "")
+        tags = (tag.strip() for tag in _TAG_SPLIT_RE.split(raw))
+        return list(dict.fromkeys(tag for tag in tags if tag))
+
     def clean_inn(self):
         """Валидация ИНН."""
         inn = self.cleaned_data.get("inn")
@@ -98,7 +129,7 @@ class ProjectForm(forms.ModelForm):
         if self.user:
             instance.user = self.user
 
-        # Сохраняем теги
+        # Теги уже разобраны в clean_tags_input
         instance.tags = self.cleaned_data.get("tags_input", [])
 
         if commit:
@@ -140,21 +171,37 @@ class ProjectStatusUpdateForm(forms.ModelForm):
 
     def save(self, commit=True):
         instance = super().save(commit=False)
-
-        # Создаем запись в истории статусов
-        if self.old_status and self.old_status != instance.status:
-            from .models import ProjectStatusHistory
-
-            ProjectStatusHistory.objects.create(
-                project=instance,
-                user=self.user,
-                old_status=self.old_status,
-                new_status=instance.status,
-                reason=self.cleaned_data.get("reason", ""),
-            )
-
-        if commit:
-            instance.save()
+        if not commit or not self.old_status:
+            if commit:
+                instance.save()
+            return instance
+
+        if self.old_status == instance.status:
+            return instance
+
+        # Условный UPDATE двух колонок: переход применяется, только если
+        # статус не успели поменять параллельно
+        instance.updated_at = timezone.now()
+        with transaction.atomic():
+            updated = Project.objects.filter(
+                pk=instance.pk, status=self.old_status
+            ).update(status=instance.status, updated_at=instance.updated_at)
+
+            if updated:
+                invalidate_project_stats(instance.user_id)
+                invalidate_project_search(instance.user_id)
+
+                # Создаем запись в истории статусов
+                ProjectStatusHistory.objects.create(
+                    project=instance,
+                    user=self.user,
+                    old_status=self.old_status,
+                    new_status=instance.status,
+                    reason=self.cleaned_data.get("reason", ""),
+                )
+
+        if not updated:
+            instance.refresh_from_db(fields=["status", "updated_at"])
         return instance
 
 
@@ -285,15 +332,8 @@ class ProjectSearchForm(forms.Form):
 
         # Фильтруем компании и контакты по пользователю
         if self.user:
-            from companies.models import Company
-            from contacts.models import Contact
-
-            self.fields["company"].queryset = Company.objects.filter(
-                user=self.user, is_active=True
-            )
-            self.fields["contact"].queryset = Contact.objects.filter(
-                user=self.user, is_active=True
-            )
+            set_user_choices(self.fields["company"], Company, self.user)
+            set_user_choices(self.fields["contact"], Contact, self.user)
 
 
 class ProjectEmailFilterForm(forms.Form):
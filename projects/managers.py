@@ -0,0 +1,165 @@
+from django.db import models
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from companies.models import Company
+from contacts.models import Contact
+
+# Статусы, при которых дедлайн уже не может быть просрочен
+CLOSED_STATUSES = ("completed", "cancelled")
+
+# Минимальная длина подстроки для поиска по триграммным индексам
+SEARCH_MIN_LENGTH = 3
+
+
+def overdue_q():
+    """
+    Условие просрочки: дедлайн прошел, проект не закрыт.
+    """
+    return Q(deadline__lt=timezone.now().date()) & ~Q(status__in=CLOSED_STATUSES)
+
+
+def search_q(user, query):
+    """
+    Условие поиска по тексту (icontains) в проектах пользователя.
+
+    Компании и контакты ищутся подзапросами (company_id IN (SELECT ...))
+    по их триграммным индексам - без JOIN и в том же SQL-запросе. Так все
+    ветки OR относятся к таблице проектов и покрываются индексами, а не
+    проверяются построчно через JOIN.
+
+    Пустой запрос не фильтрует. Для 1-2 символов подстрочный поиск по
+    триграммам не работает, поэтому ищется только префикс названия проекта,
+    компании и имени контакта (якорный LIKE 'ab%' триграммные индексы
+    поддерживают) - теми же подзапросами.
+    """
+    query = query.strip()
+    if not query:
+        return Q()
+    if len(query) < SEARCH_MIN_LENGTH:
+        return Q(title__istartswith=query) | _related_search_q(
+            user, "istartswith", query
+        )
+
+    return (
+        Q(title__icontains=query)
+        | Q(description__icontains=query)
+        | Q(inn__icontains=query)
+        | Q(project_number__icontains=query)
+        | _related_search_q(user, "icontains", query)
+    )
+
+
+def _related_search_q(user, lookup, query):
+    """
+    Проекты, чьи компания или контакт подходят под поиск.
+
+    id передаются ленивыми QuerySet: Postgres выполняет их как подзапросы
+    внутри основного запроса, без отдельных запросов и длинных списков IN.
+    """
+    companies = Company.objects.filter(user=user, **{f"name__{lookup}": query}).values(
+        "pk"
+    )
+    contacts = Contact.objects.filter(
+        Q(**{f"first_name__{lookup}": query}) | Q(**{f"last_name__{lookup}": query}),
+        user=user,
+    ).values("pk")
+    return Q(company_id__in=companies) | Q(contact_id__in=contacts)
+
+
+def _related_count(model, **filters):
+    """
+    COUNT(*) строк связанной модели проекта подзапросом (0 вместо NULL).
+    """
+    rows = (
+        model.objects.filter(project=OuterRef("pk"), **filters)
+        .order_by()
+        .values("project")
+        .annotate(c=Count("*"))
+        .values("c")
+    )
+    return Coalesce(Subquery(rows, output_field=IntegerField()), 0)
+
+
+class ProjectQuerySet(models.QuerySet):
+    """
+    QuerySet проектов с типовыми наборами связанных данных.
+    """
+
+    def with_related(self):
+        """
+        Компания и контакт одним JOIN - для списков и карточек проектов.
+        """
+        return self.select_related("company", "contact")
+
+    def with_notes(self):
+        """
+        Заметки проекта вместе с авторами одним дополнительным запросом.
+        """
+        return self.prefetch_related("project_notes__user")
+
+    def with_overdue(self):
+        """
+        Флаг просрочки (deadline_overdue), вычисленный в SQL одним выражением
+        вместо timezone.now() на каждый проект.
+        """
+        return self.annotate(
+            deadline_overdue=Case(
+                When(overdue_q(), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
+    def with_detail_stats(self):
+        """
+        Счетчики карточки проекта (письма, заметки, история статусов).
+
+        Каждый счетчик - коррелированный подзапрос по FK индексу: все
+        считается в запросе самого проекта, без JOIN трех связей, который
+        перемножил бы строки.
+        """
+        from .models import ProjectEmail, ProjectNote, ProjectStatusHistory
+
+        return self.annotate(
+            total_emails=_related_count(ProjectEmail),
+            emails_with_attachments=_related_count(ProjectEmail, has_attachments=True),
+            total_notes=_related_count(ProjectNote),
+            private_notes=_related_count(ProjectNote, is_private=True),
+            important_notes=_related_count(ProjectNote, is_important=True),
+            status_changes=_related_count(ProjectStatusHistory),
+        )
+
+    def overdue(self):
+        """
+        Просроченные проекты: дедлайн прошел, проект не закрыт.
+
+        Условие совпадает с частичным индексом proj_overdue_partial.
+        """
+        return self.filter(overdue_q())
+
+    def search(self, user, query):
+        """
+        Поиск по тексту в проектах пользователя (см. search_q).
+        """
+        return self.filter(search_q(user, query))
+
+
+class ProjectManager(models.Manager.from_queryset(ProjectQuerySet)):
+    """
+    Менеджер модели Project.
+
+    JOIN-ы не навязываются по умолчанию: менеджер используется и для
+    count()/update()/обратных связей, где они не нужны.
+    """
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:51
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0003_alter_company_inn"),
+        ("contacts", "0003_contact_is_email_verified_contact_is_phone_verified"),
+        ("projects", "0003_alter_project_inn"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tags"], name="project_tags_gin", opclasses=["jsonb_path_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0003_alter_company_inn"),
+        ("contacts", "0003_contact_is_email_verified_contact_is_phone_verified"),
+        ("projects", "0004_project_tags_gin"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["user", "is_active", "-created_at"],
+                name="proj_user_active_created",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ["completed", "cancelled"]), _negated=True
+                ),
+                fields=["user", "deadline"],
+                name="proj_overdue_partial",
+            ),
+        ),
+    ]
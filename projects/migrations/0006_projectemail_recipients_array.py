@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:56
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+# jsonb -> varchar[] нельзя привести через ALTER ... USING (подзапросы там
+# запрещены), поэтому данные переносятся через временную колонку
+FORWARD_SQL = """
+ALTER TABLE projects_projectemail
+    ADD COLUMN recipients_array varchar(255)[] NOT NULL DEFAULT '{}';
+UPDATE projects_projectemail
+    SET recipients_array = ARRAY(
+        SELECT jsonb_array_elements_text(recipients)
+    )::varchar(255)[]
+    WHERE jsonb_typeof(recipients) = 'array';
+ALTER TABLE projects_projectemail DROP COLUMN recipients;
+ALTER TABLE projects_projectemail RENAME COLUMN recipients_array TO recipients;
+ALTER TABLE projects_projectemail ALTER COLUMN recipients DROP DEFAULT;
+"""
+
+REVERSE_SQL = """
+ALTER TABLE projects_projectemail
+    ADD COLUMN recipients_json jsonb NOT NULL DEFAULT '[]';
+UPDATE projects_projectemail SET recipients_json = to_jsonb(recipients);
+ALTER TABLE projects_projectemail DROP COLUMN recipients;
+ALTER TABLE projects_projectemail RENAME COLUMN recipients_json TO recipients;
+ALTER TABLE projects_projectemail ALTER COLUMN recipients DROP DEFAULT;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0005_project_list_indexes"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(FORWARD_SQL, REVERSE_SQL),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="projectemail",
+                    name="recipients",
+                    field=django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        default=list,
+                        size=None,
+                        verbose_name="recipients",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="projectemail",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["recipients"], name="projectemail_recipients_gin"
+            ),
+        ),
+    ]
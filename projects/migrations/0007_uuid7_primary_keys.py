@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:59
+
+import crm.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_projectemail_recipients_array"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="project",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectattachment",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectemail",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectnote",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectstatushistory",
+            name="id",
+            field=models.UUIDField(
+                default=crm.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # pg_trgm включается миграцией триграммных индексов email
+        ("emails", "0003_emailmessage_trigram_indexes"),
+        ("companies", "0005_company_name_trgm"),
+        ("contacts", "0005_contact_name_trgm"),
+        ("projects", "0007_uuid7_primary_keys"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("title"), name="gin_trgm_ops"
+                ),
+                name="project_title_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("description"),
+                    name="gin_trgm_ops",
+                ),
+                name="project_description_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("inn"), name="gin_trgm_ops"
+                ),
+                name="project_inn_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("project_number"),
+                    name="gin_trgm_ops",
+                ),
+                name="project_number_trgm",
+            ),
+        ),
+    ]
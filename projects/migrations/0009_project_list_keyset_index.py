@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0005_company_name_trgm"),
+        ("contacts", "0005_contact_name_trgm"),
+        ("projects", "0008_project_search_trgm"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="project",
+            name="proj_user_active_created",
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["user", "is_active", "-created_at", "-id"],
+                name="proj_user_active_created_id",
+            ),
+        ),
+    ]
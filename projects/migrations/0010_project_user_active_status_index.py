@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0005_company_name_trgm"),
+        ("contacts", "0005_contact_name_trgm"),
+        ("projects", "0009_project_list_keyset_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["user", "is_active", "status"], name="proj_user_active_status"
+            ),
+        ),
+    ]
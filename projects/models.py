@@ -1,18 +1,25 @@
-import uuid
-from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models, transaction
+from django.db.models.functions import Upper
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from crm.utils import uuid7
 from users.models import User
 from companies.models import Company
 from contacts.models import Contact
 
+from .managers import CLOSED_STATUSES, ProjectManager
+from .utils import invalidate_project_search, invalidate_project_stats
+
 
 class Project(models.Model):
     """
     Модель проекта.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="projects", verbose_name=_("user")
     )
@@ -93,6 +100,8 @@ class Project(models.Model):
         help_text=_("ID email из которого создан проект"),
     )
 
+    objects = ProjectManager()
+
     class Meta:
         verbose_name = _("project")
         verbose_name_plural = _("projects")
@@ -106,17 +115,97 @@ class Project(models.Model):
             models.Index(fields=["user", "deadline"]),
             models.Index(fields=["company", "status"]),
             models.Index(fields=["contact", "status"]),
+            # Основной список: user + is_active, сортировка и keyset-курсор
+            # по (-created_at, -id)
+            models.Index(
+                fields=["user", "is_active", "-created_at", "-id"],
+                name="proj_user_active_created_id",
+            ),
+            # Фильтр списка и статистика по статусу среди активных проектов
+            models.Index(
+                fields=["user", "is_active", "status"],
+                name="proj_user_active_status",
+            ),
+            # Просроченные: дедлайн у незавершенных проектов
+            models.Index(
+                fields=["user", "deadline"],
+                condition=~models.Q(status__in=["completed", "cancelled"]),
+                name="proj_overdue_partial",
+            ),
+            # Фильтр по тегам: tags @> '["tag", ...]'
+            GinIndex(
+                fields=["tags"], opclasses=["jsonb_path_ops"], name="project_tags_gin"
+            ),
+            # Триграммные индексы под icontains поиск (UPPER(col) LIKE UPPER(%s))
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="project_title_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                name="project_description_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("inn"), name="gin_trgm_ops"),
+                name="project_inn_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("project_number"), name="gin_trgm_ops"),
+                name="project_number_trgm",
+            ),
         ]
 
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
 
+    # Название на момент загрузки из БД (None - неизвестно)
+    _loaded_title = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_title = instance.__dict__.get("title")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        При сохранении сбрасываем кэш статистики и поиска и, если название
+        изменилось, обновляем его в связанных email.
+        """
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        invalidate_project_stats(self.user_id)
+        invalidate_project_search(self.user_id)
+
+        update_fields = kwargs.get("update_fields")
+        if (
+            not adding
+            and (update_fields is None or "title" in update_fields)
+            and self.title != self._loaded_title
+        ):
+            self.source_emails.exclude(related_project_title=self.title).update(
+                related_project_title=self.title
+            )
+        self._loaded_title = self.title
+
+    def delete(self, *args, **kwargs):
+        """
+        При удалении сбрасываем кэш статистики и поиска проектов.
+        """
+        result = super().delete(*args, **kwargs)
+        invalidate_project_stats(self.user_id)
+        invalidate_project_search(self.user_id)
+        return result
+
     @property
     def is_overdue(self):
         """Проверяет, просрочен ли проект."""
-        if self.deadline and self.status not in ["completed", "cancelled"]:
-            from django.utils import timezone
+        # Списки проектов считают флаг в SQL (ProjectQuerySet.with_overdue)
+        overdue = self.__dict__.get("deadline_overdue")
+        if overdue is not None:
+            return overdue
 
+        if self.deadline and self.status not in CLOSED_STATUSES:
             return timezone.now().date() > self.deadline
         return False
 
@@ -124,29 +213,31 @@ class Project(models.Model):
     def days_until_deadline(self):
         """Количество дней до дедлайна."""
         if self.deadline:
-            from django.utils import timezone
-
-            today = timezone.now().date()
-            if self.deadline >= today:
-                return (self.deadline - today).days
-            else:
-                return -(today - self.deadline).days
+            return (self.deadline - timezone.now().date()).days
         return None
 
     @property
     def progress_percentage(self):
         """Процент выполнения проекта на основе email переписки."""
-        total_emails = self.emails.count()
+        # emails_count аннотируют списки проектов, чтобы не считать на каждой строке
+        total_emails = getattr(self, "emails_count", None)
+        if total_emails is None:
+            total_emails = self.emails.count()
+        return self.calculate_progress(self.status, total_emails)
+
+    @staticmethod
+    def calculate_progress(status, total_emails):
+        """Процент выполнения по статусу и числу писем (для строк values())."""
         if total_emails == 0:
             return 0
 
         # Простая логика: чем больше email, тем выше прогресс
         # В реальном проекте можно использовать более сложную логику
-        if self.status == "completed":
+        if status == "completed":
             return 100
-        elif self.status == "in_progress":
+        elif status == "in_progress":
             return min(80, total_emails * 10)
-        elif self.status == "on_hold":
+        elif status == "on_hold":
             return min(30, total_emails * 5)
         else:
             return min(10, total_emails * 2)
@@ -157,15 +248,26 @@ class Project(models.Model):
 
     def add_tag(self, tag):
         """Добавить тег."""
-        if tag not in self.tags:
-            self.tags.append(tag)
-            self.save()
+        self.add_tags([tag])
+
+    def add_tags(self, tags):
+        """Добавить несколько тегов одним сохранением."""
+        existing = set(self.tags)
+        new_tags = []
+        for tag in tags:
+            if tag not in existing:
+                existing.add(tag)
+                new_tags.append(tag)
+
+        if new_tags:
+            self.tags.extend(new_tags)
+            self.save(update_fields=["tags", "updated_at"])
 
     def remove_tag(self, tag):
         """Удалить тег."""
         if tag in self.tags:
             self.tags.remove(tag)
-            self.save()
+            self.save(update_fields=["tags", "updated_at"])
 
 
 class ProjectEmail(models.Model):
@@ -173,7 +275,7 @@ class ProjectEmail(models.Model):
     Email связанный с проектом.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     project = models.ForeignKey(
         Project,
         on_delete=models.CASCADE,
@@ -185,7 +287,11 @@ class ProjectEmail(models.Model):
     message_id = models.CharField(_("message id"), max_length=255, unique=True)
     subject = models.CharField(_("subject"), max_length=500)
     sender = models.EmailField(_("sender"))
-    recipients = models.JSONField(_("recipients"), default=list)  # Список получателей
+    recipients = ArrayField(
+        models.CharField(max_length=255),
+        default=list,
+        verbose_name=_("recipients"),
+    )  # Список получателей
     body = models.TextField(_("body"))
 
     # Метаданные
@@ -219,11 +325,72 @@ class ProjectEmail(models.Model):
             models.Index(fields=["parsed_inn"]),
             models.Index(fields=["parsed_project_number"]),
             models.Index(fields=["is_processed"]),
+            # Поиск писем по получателю: recipients @> ARRAY[...]
+            GinIndex(fields=["recipients"], name="projectemail_recipients_gin"),
         ]
 
     def __str__(self):
         return f"{self.subject} ({self.sender})"
 
+    INGEST_BATCH_SIZE = 500
+
+    @classmethod
+    def bulk_ingest(cls, items, move=False):
+        """
+        Пакетная запись писем проекта.
+
+        Письма с уже известным message_id пропускаются (ON CONFLICT DO
+        NOTHING). С move=True письмо перепривязывается: запись с тем же
+        message_id в другом проекте того же пользователя переносится в новый
+        проект (UPDATE вместе с вложениями), а не вставляется заново.
+        bulk_create не отправляет post_save, поэтому уведомление о привязке
+        уходит одним пакетом после commit и только по реально вставленным и
+        перенесенным строкам. Возвращает список этих объектов.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        moved_message_ids = set()
+        with transaction.atomic():
+            if move:
+                for item in items:
+                    moved = (
+                        cls.objects.filter(
+                            message_id=item.message_id,
+                            project__user_id=item.project.user_id,
+                        )
+                        .exclude(project_id=item.project_id)
+                        .update(project_id=item.project_id)
+                    )
+                    if moved:
+                        moved_message_ids.add(item.message_id)
+                items = [
+                    item for item in items if item.message_id not in moved_message_ids
+                ]
+
+            cls.objects.bulk_create(
+                items, batch_size=cls.INGEST_BATCH_SIZE, ignore_conflicts=True
+            )
+
+        # При конфликте строка остается со своим id - по id отличаем новые
+        inserted_ids = set(
+            cls.objects.filter(pk__in=[item.pk for item in items]).values_list(
+                "pk", flat=True
+            )
+        )
+        linked = [item for item in items if item.pk in inserted_ids]
+        if moved_message_ids:
+            linked += cls.objects.filter(
+                message_id__in=moved_message_ids
+            ).select_related("project")
+
+        if linked:
+            from .signals import notify_emails_linked
+
+            transaction.on_commit(lambda: notify_emails_linked(linked))
+        return linked
+
     @property
     def recipients_list(self):
         """Получить список получателей."""
@@ -240,7 +407,7 @@ class ProjectNote(models.Model):
     Заметка к проекту.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     project = models.ForeignKey(
         Project,
         on_delete=models.CASCADE,
@@ -295,7 +462,7 @@ class ProjectAttachment(models.Model):
     Вложение к проекту (из email).
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     project_email = models.ForeignKey(
         ProjectEmail,
         on_delete=models.CASCADE,
@@ -339,7 +506,7 @@ class ProjectStatusHistory(models.Model):
     История изменения статусов проекта.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     project = models.ForeignKey(
         Project,
         on_delete=models.CASCADE,
@@ -1,3 +1,6 @@
+from collections import defaultdict
+
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -13,16 +16,18 @@ def project_created_handler(sender, instance, created, **kwargs):
     Обработчик создания/обновления проекта.
     """
     if created:
-        # Отправляем уведомление создателю проекта
+        # Отправляем уведомление создателю проекта после фиксации транзакции
         from users.signals import send_realtime_notification
 
-        send_realtime_notification(
-            instance.user.id,
-            "project_created",
-            {
-                "project_id": str(instance.id),
-                "title": instance.title,
-            },
+        transaction.on_commit(
+            lambda: send_realtime_notification(
+                instance.user_id,
+                "project_created",
+                {
+                    "project_id": str(instance.id),
+                    "title": instance.title,
+                },
+            )
         )
 
 
@@ -32,27 +37,59 @@ def project_email_linked_handler(sender, instance, created, **kwargs):
     Обработчик привязки email к проекту.
     """
     if created:
+        # Рассылка по каналам не держит запрос/транзакцию - после commit
+        transaction.on_commit(lambda: notify_emails_linked([instance]))
+
+
+def notify_emails_linked(project_emails):
+    """
+    Уведомления о привязке email к проектам.
+
+    Письма группируются по проекту: на проект уходит одно сообщение в
+    группу и одно уведомление владельцу, сколько бы писем ни привязали.
+    """
+    by_project = defaultdict(list)
+    for project_email in project_emails:
+        by_project[project_email.project_id].append(project_email)
+    if not by_project:
+        return
+
+    from users.signals import send_realtime_notification
+
+    group_send = async_to_sync(get_channel_layer().group_send)
+    timestamp = timezone.now().isoformat()
+
+    for linked in by_project.values():
+        project = linked[0].project
+
         # Отправляем уведомление в группу проекта
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            f"project_{instance.project.id}",
-            {
+        if len(linked) == 1:
+            event = {
                 "type": "email_linked",
-                "email_id": str(instance.id),
-                "subject": instance.subject,
-                "timestamp": timezone.now().isoformat(),
-            },
-        )
+                "email_id": str(linked[0].id),
+                "subject": linked[0].subject,
+            }
+            message = (
+                f'Email "{linked[0].subject}" привязан к проекту "{project.title}"'
+            )
+        else:
+            event = {
+                "type": "emails_linked",
+                "emails": [
+                    {"email_id": str(email.id), "subject": email.subject}
+                    for email in linked
+                ],
+            }
+            message = f'{len(linked)} email привязано к проекту "{project.title}"'
+        group_send(f"project_{project.id}", {**event, "timestamp": timestamp})
 
         # Отправляем уведомление пользователю
-        from users.signals import send_realtime_notification
-
         send_realtime_notification(
-            instance.project.user.id,
+            project.user_id,
             "system_notification",
             {
                 "level": "info",
                 "title": "Email привязан к проекту",
-                "message": f'Email "{instance.subject}" привязан к проекту "{instance.project.title}"',
+                "message": message,
             },
         )
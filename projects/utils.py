@@ -0,0 +1,46 @@
+import uuid
+from typing import Any
+
+from django.core.cache import cache
+
+# Время жизни кэша статистики проектов (сек). Просрочка меняется со
+# сменой дня без записи в БД - TTL ограничивает устаревание
+PROJECT_STATS_CACHE_TIMEOUT = 60
+
+
+def project_stats_cache_key(user_id: Any) -> str:
+    """
+    Ключ кэша статистики проектов пользователя.
+    """
+    return f"project_stats:{user_id}"
+
+
+def invalidate_project_stats(user_id: Any) -> None:
+    """
+    Сбрасывает кэшированную статистику проектов пользователя.
+    """
+    cache.delete(project_stats_cache_key(user_id))
+
+
+def project_search_version_key(user_id: Any) -> str:
+    """
+    Ключ версии кэша AJAX поиска проектов пользователя.
+    """
+    return f"project_search_version:{user_id}"
+
+
+def project_search_version(user_id: Any) -> str:
+    """
+    Текущая версия кэша AJAX поиска проектов пользователя. Входит в ключи
+    закэшированных ответов, поэтому смена версии делает их недоступными.
+    """
+    return cache.get_or_set(
+        project_search_version_key(user_id), lambda: uuid.uuid4().hex, None
+    )
+
+
+def invalidate_project_search(user_id: Any) -> None:
+    """
+    Сбрасывает кэшированные ответы AJAX поиска проектов пользователя.
+    """
+    cache.set(project_search_version_key(user_id), uuid.uuid4().hex, None)
@@ -1,12 +1,21 @@
+import hashlib
 import json
+import uuid
+from datetime import datetime
+from urllib.parse import urlencode
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q, Count, Prefetch
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.db.models import Q, Count
+from django.db.models.functions import Substr
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse_lazy
-from django.utils.translation import gettext_lazy as _
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.utils.translation import get_language, gettext_lazy as _
 from django.views.decorators.http import require_POST
 from django.views.generic import (
     ListView,
@@ -17,9 +26,12 @@ from django.views.generic import (
 )
 from rest_framework import status
 from rest_framework.decorators import api_view
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from companies.models import Company
+from contacts.models import Contact
 from users.permissions import RBACPermission, check_user_permission
 from .forms import (
     ProjectForm,
@@ -28,8 +40,62 @@ from .forms import (
     ProjectSearchForm,
     ProjectEmailFilterForm,
 )
-from .models import Project, ProjectEmail, ProjectNote
-from logly import logger
+from .managers import overdue_q, search_q
+from .models import Project
+from .utils import (
+    PROJECT_STATS_CACHE_TIMEOUT,
+    project_search_version,
+    project_stats_cache_key,
+)
+
+
+# Подписи статусов и приоритетов для строк values() (lazy - переводятся при
+# выводе на языке запроса)
+STATUS_LABELS = dict(Project._meta.get_field("status").flatchoices)
+PRIORITY_LABELS = dict(Project._meta.get_field("priority").flatchoices)
+
+
+# Параметры запроса, фильтрующие проекты по точному значению поля
+PROJECT_EXACT_FILTERS = (
+    ("status", "status"),
+    ("priority", "priority"),
+    ("company", "company_id"),
+    ("contact", "contact_id"),
+    ("inn", "inn"),
+    ("project_number", "project_number"),
+)
+
+
+def _is_checked(value):
+    """Флаг из GET: чекбокс формы ("on") или AJAX ("true"/"1")."""
+    return (value or "").lower() in ("on", "true", "1")
+
+
+def project_filters(params, user):
+    """
+    Условие выборки проектов по параметрам запроса одним Q - общее для
+    списка и AJAX поиска.
+    """
+    filters = Q(user=user, is_active=True) & search_q(user, params.get("q", ""))
+
+    for param, field in PROJECT_EXACT_FILTERS:
+        value = params.get(param, "")
+        if value:
+            filters &= Q(**{field: value})
+
+    if _is_checked(params.get("has_deadline")):
+        filters &= Q(deadline__isnull=False)
+
+    if _is_checked(params.get("is_overdue")):
+        filters &= overdue_q()
+
+    # Одно условие @> со всеми тегами (GIN индекс по tags)
+    tags = params.get("tags", "")
+    tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+    if tag_list:
+        filters &= Q(tags__contains=tag_list)
+
+    return filters
 
 
 class ProjectListView(LoginRequiredMixin, ListView):
@@ -42,95 +108,124 @@ class ProjectListView(LoginRequiredMixin, ListView):
     context_object_name = "projects"
     paginate_by = 20
 
+    # Поля, которые выводит шаблон списка; notes/tags и прочие широкие
+    # колонки не загружаются
+    list_fields = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "inn",
+        "project_number",
+        "deadline",
+        "created_at",
+        "company__name",
+        "contact__first_name",
+        "contact__last_name",
+    )
+
     def get_queryset(self):
         queryset = (
-            Project.objects.filter(user=self.request.user, is_active=True)
-            .select_related("company", "contact")
-            .prefetch_related(
-                Prefetch(
-                    "emails", queryset=ProjectEmail.objects.order_by("-received_at")
-                )
-            )
+            Project.objects.filter(project_filters(self.request.GET, self.request.user))
+            .with_related()
+            .only(*self.list_fields)
+            .with_overdue()
+            .annotate(emails_count=Count("emails"))
         )
-        logger.info(f"projects: {queryset}")
-
-        # Поиск
-        search_query = self.request.GET.get("q", "")
-        if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query)
-                | Q(description__icontains=search_query)
-                | Q(inn__icontains=search_query)
-                | Q(project_number__icontains=search_query)
-                | Q(company__name__icontains=search_query)
-                | Q(contact__first_name__icontains=search_query)
-                | Q(contact__last_name__icontains=search_query)
-            )
-
-        # Фильтры
-        status_filter = self.request.GET.get("status", "")
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-
-        priority_filter = self.request.GET.get("priority", "")
-        if priority_filter:
-            queryset = queryset.filter(priority=priority_filter)
 
-        company_id = self.request.GET.get("company", "")
-        if company_id:
-            queryset = queryset.filter(company_id=company_id)
+        # id - однозначный порядок при равных created_at для keyset-курсора
+        return queryset.order_by("-created_at", "-id")
 
-        contact_id = self.request.GET.get("contact", "")
-        if contact_id:
-            queryset = queryset.filter(contact_id=contact_id)
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Keyset-пагинация по (created_at, id).
 
-        inn_filter = self.request.GET.get("inn", "")
-        if inn_filter:
-            queryset = queryset.filter(inn=inn_filter)
-
-        project_number_filter = self.request.GET.get("project_number", "")
-        if project_number_filter:
-            queryset = queryset.filter(project_number=project_number_filter)
-
-        if self.request.GET.get("has_deadline"):
-            queryset = queryset.exclude(deadline__isnull=True)
-
-        if self.request.GET.get("is_overdue"):
+        Следующая страница выбирается условием "после последней показанной
+        строки" по индексу вместо OFFSET, общее число проектов не считается.
+        """
+        cursor = self._parse_cursor(self.request.GET.get("after", ""))
+        if cursor:
+            created_at, pk = cursor
             queryset = queryset.filter(
-                deadline__lt=(
-                    self.request.user.date_joined.date()
-                    if hasattr(self.request.user, "date_joined")
-                    else None
-                )
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
             )
 
-        # Фильтр по тегам
-        tags = self.request.GET.get("tags", "")
-        if tags:
-            tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
-            for tag in tag_list:
-                queryset = queryset.filter(tags__contains=[tag])
+        # Лишняя строка показывает, есть ли следующая страница
+        rows = list(queryset[: page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+
+        self.next_cursor = (
+            f"{rows[-1].created_at.isoformat()},{rows[-1].pk}" if has_next else ""
+        )
+        return None, None, rows, bool(cursor) or has_next
 
-        return queryset.order_by("-created_at")
+    @staticmethod
+    def _parse_cursor(value):
+        """Курсор "created_at,id" из параметра after (None, если некорректен)."""
+        created_at, _, pk = value.partition(",")
+        try:
+            return datetime.fromisoformat(created_at), uuid.UUID(pk)
+        except ValueError:
+            return None
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context["next_cursor"] = getattr(self, "next_cursor", "")
         context["search_form"] = ProjectSearchForm(
             user=self.request.user, data=self.request.GET
         )
 
-        # Статистика
-        projects = Project.objects.filter(user=self.request.user, is_active=True)
-        context["stats"] = {
-            "total_projects": projects.count(),
-            "in_progress_projects": projects.filter(status="in_progress").count(),
-            "completed_projects": projects.filter(status="completed").count(),
-            "overdue_projects": sum(1 for p in projects if p.is_overdue),
-        }
+        # Статистика не зависит от фильтров и страницы
+        context["stats"] = get_project_stats(self.request.user)
 
         return context
 
 
+def get_project_stats(user):
+    """
+    Статистика проектов пользователя (кэшируется, сбрасывается при записи).
+    """
+    return cache.get_or_set(
+        project_stats_cache_key(user.id),
+        lambda: _compute_project_stats(user),
+        PROJECT_STATS_CACHE_TIMEOUT,
+    )
+
+
+def _compute_project_stats(user):
+    """
+    Статистика проектов одним агрегирующим запросом.
+    """
+    return Project.objects.filter(user=user, is_active=True).aggregate(
+        total_projects=Count("id"),
+        in_progress_projects=Count("id", filter=Q(status="in_progress")),
+        completed_projects=Count("id", filter=Q(status="completed")),
+        overdue_projects=Count("id", filter=overdue_q()),
+    )
+
+
+def project_email_filters(
+    sender="", date_from=None, date_to=None, has_attachments=False, search_body=""
+):
+    """
+    Условие фильтра писем проекта одним Q (пустые значения не фильтруют).
+    """
+    filters = Q()
+    if sender:
+        filters &= Q(sender__icontains=sender)
+    if date_from:
+        filters &= Q(received_at__date__gte=date_from)
+    if date_to:
+        filters &= Q(received_at__date__lte=date_to)
+    if has_attachments:
+        filters &= Q(has_attachments=True)
+    if search_body:
+        filters &= Q(body__icontains=search_body)
+    return filters
+
+
 class ProjectDetailView(LoginRequiredMixin, DetailView):
     """
     Детальная информация о проекте.
@@ -141,51 +236,22 @@ class ProjectDetailView(LoginRequiredMixin, DetailView):
     context_object_name = "project"
 
     def get_queryset(self):
+        # Письма, заметки и история выбираются ниже с фильтрами и лимитами -
+        # prefetch всех писем проекта (с телами) здесь не нужен
         return (
             Project.objects.filter(user=self.request.user, is_active=True)
-            .select_related("company", "contact")
-            .prefetch_related(
-                Prefetch(
-                    "emails", queryset=ProjectEmail.objects.order_by("-received_at")
-                ),
-                Prefetch(
-                    "project_notes",
-                    queryset=ProjectNote.objects.select_related("user").order_by(
-                        "-created_at"
-                    ),
-                ),
-                "status_history",
-            )
+            .with_related()
+            .with_detail_stats()
         )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        project = self.get_object()
+        project = self.object
 
         # Email переписка
         email_filter_form = ProjectEmailFilterForm(self.request.GET)
-        emails = project.emails.all()
-
-        # Применяем фильтры
-        if email_filter_form.is_valid():
-            if email_filter_form.cleaned_data.get("sender"):
-                emails = emails.filter(
-                    sender__icontains=email_filter_form.cleaned_data["sender"]
-                )
-            if email_filter_form.cleaned_data.get("date_from"):
-                emails = emails.filter(
-                    received_at__date__gte=email_filter_form.cleaned_data["date_from"]
-                )
-            if email_filter_form.cleaned_data.get("date_to"):
-                emails = emails.filter(
-                    received_at__date__lte=email_filter_form.cleaned_data["date_to"]
-                )
-            if email_filter_form.cleaned_data.get("has_attachments"):
-                emails = emails.filter(has_attachments=True)
-            if email_filter_form.cleaned_data.get("search_body"):
-                emails = emails.filter(
-                    body__icontains=email_filter_form.cleaned_data["search_body"]
-                )
+        cleaned = email_filter_form.cleaned_data if email_filter_form.is_valid() else {}
+        emails = project.emails.filter(project_email_filters(**cleaned))
 
         context["emails"] = emails[:50]  # Ограничение для производительности
         context["email_filter_form"] = email_filter_form
@@ -206,16 +272,14 @@ class ProjectDetailView(LoginRequiredMixin, DetailView):
         )
         context["note_form"] = ProjectNoteForm(project=project, user=self.request.user)
 
-        # Статистика
+        # Статистика посчитана в запросе проекта (with_detail_stats)
         context["stats"] = {
-            "total_emails": project.emails.count(),
-            "emails_with_attachments": project.emails.filter(
-                has_attachments=True
-            ).count(),
-            "total_notes": project.project_notes.count(),
-            "private_notes": project.project_notes.filter(is_private=True).count(),
-            "important_notes": project.project_notes.filter(is_important=True).count(),
-            "status_changes": project.status_history.count(),
+            "total_emails": project.total_emails,
+            "emails_with_attachments": project.emails_with_attachments,
+            "total_notes": project.total_notes,
+            "private_notes": project.private_notes,
+            "important_notes": project.important_notes,
+            "status_changes": project.status_changes,
         }
 
         return context
@@ -287,94 +351,92 @@ class ProjectDeleteView(LoginRequiredMixin, DeleteView):
 # AJAX Views
 
 
+PROJECT_SEARCH_CACHE_TIMEOUT = 5
+
+
 @login_required
 def project_search_ajax(request):
     """
     AJAX поиск проектов.
+
+    Поиск срабатывает на ввод, и одинаковые запросы приходят подряд -
+    готовый ответ кэшируется на несколько секунд по пользователю и
+    параметрам. ETag ответа позволяет клиенту получить 304 без тела.
+    Версия в ключе меняется при сохранении и удалении проектов
+    пользователя (invalidate_project_search).
     """
-    query = request.GET.get("q", "")
-    status_filter = request.GET.get("status", "")
-    priority_filter = request.GET.get("priority", "")
-    company_id = request.GET.get("company", "")
-    contact_id = request.GET.get("contact", "")
-    inn = request.GET.get("inn", "")
-    project_number = request.GET.get("project_number", "")
-    has_deadline = request.GET.get("has_deadline", "").lower() == "true"
-    is_overdue = request.GET.get("is_overdue", "").lower() == "true"
-    tags = request.GET.get("tags", "")
-
-    projects = Project.objects.filter(user=request.user, is_active=True).select_related(
-        "company", "contact"
+    params = urlencode(sorted(request.GET.lists()), doseq=True)
+    params_hash = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+    version = project_search_version(request.user.id)
+    cache_key = (
+        f"project_search:{request.user.id}:{version}:{get_language()}:{params_hash}"
     )
 
-    if query:
-        projects = projects.filter(
-            Q(title__icontains=query)
-            | Q(description__icontains=query)
-            | Q(inn__icontains=query)
-            | Q(project_number__icontains=query)
-            | Q(company__name__icontains=query)
-            | Q(contact__first_name__icontains=query)
-            | Q(contact__last_name__icontains=query)
-        )
-
-    if status_filter:
-        projects = projects.filter(status=status_filter)
-
-    if priority_filter:
-        projects = projects.filter(priority=priority_filter)
-
-    if company_id:
-        projects = projects.filter(company_id=company_id)
+    def build_response():
+        content = json.dumps(
+            {"projects": _search_projects(request)}, cls=DjangoJSONEncoder
+        ).encode()
+        etag = quote_etag(hashlib.blake2b(content, digest_size=16).hexdigest())
+        return content, etag
 
-    if contact_id:
-        projects = projects.filter(contact_id=contact_id)
-
-    if inn:
-        projects = projects.filter(inn=inn)
-
-    if project_number:
-        projects = projects.filter(project_number=project_number)
-
-    if has_deadline:
-        projects = projects.exclude(deadline__isnull=True)
+    content, etag = cache.get_or_set(
+        cache_key, build_response, PROJECT_SEARCH_CACHE_TIMEOUT
+    )
+    response = HttpResponse(content, content_type="application/json")
+    response["ETag"] = etag
+    return get_conditional_response(request, etag=etag, response=response)
 
-    if is_overdue:
-        projects = projects.filter(
-            deadline__lt=(
-                request.user.date_joined.date()
-                if hasattr(request.user, "date_joined")
-                else None
-            )
-        )
 
-    if tags:
-        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
-        for tag in tag_list:
-            projects = projects.filter(tags__contains=[tag])
+def _search_projects(request):
+    """
+    Найти проекты пользователя по параметрам запроса.
+    """
+    projects = (
+        Project.objects.filter(project_filters(request.GET, request.user))
+        .with_overdue()
+        .annotate(emails_count=Count("emails"))
+    )
 
-    projects = projects[:50]  # Ограничение результатов
+    # Строки values() вместо экземпляров модели: нужны только скаляры
+    rows = projects.values(
+        "id",
+        "title",
+        "status",
+        "priority",
+        "inn",
+        "project_number",
+        "deadline",
+        "deadline_overdue",
+        "emails_count",
+        "created_at",
+        "company__name",
+        "contact__first_name",
+        "contact__last_name",
+    )
+    # Meta.ordering не применяется к запросам с GROUP BY - задаем явно
+    rows = rows.order_by("-created_at")[:50]  # Ограничение результатов
 
-    data = [
+    return [
         {
-            "id": str(project.id),
-            "title": project.title,
-            "status": project.get_status_display(),
-            "priority": project.get_priority_display(),
-            "company": project.company.name if project.company else "",
-            "contact": project.contact.full_name if project.contact else "",
-            "inn": project.inn or "",
-            "project_number": project.project_number or "",
-            "deadline": project.deadline.isoformat() if project.deadline else None,
-            "is_overdue": project.is_overdue,
-            "progress": project.progress_percentage,
-            "created_at": project.created_at.strftime("%d.%m.%Y"),
+            "id": str(row["id"]),
+            "title": row["title"],
+            "status": str(STATUS_LABELS.get(row["status"], row["status"])),
+            "priority": str(PRIORITY_LABELS.get(row["priority"], row["priority"])),
+            "company": row["company__name"] or "",
+            "contact": (
+                f"{row['contact__first_name'] or ''} "
+                f"{row['contact__last_name'] or ''}"
+            ).strip(),
+            "inn": row["inn"] or "",
+            "project_number": row["project_number"] or "",
+            "deadline": row["deadline"].isoformat() if row["deadline"] else None,
+            "is_overdue": row["deadline_overdue"],
+            "progress": Project.calculate_progress(row["status"], row["emails_count"]),
+            "created_at": row["created_at"].strftime("%d.%m.%Y"),
         }
-        for project in projects
+        for row in rows
     ]
 
-    return JsonResponse({"projects": data})
-
 
 @login_required
 @require_POST
@@ -382,27 +444,25 @@ def update_project_status_ajax(request, project_id):
     """
     AJAX обновление статуса проекта.
     """
-    try:
-        project = Project.objects.get(id=project_id, user=request.user)
-        form = ProjectStatusUpdateForm(
-            request.POST, instance=project, user=request.user
-        )
-
-        if form.is_valid():
-            updated_project = form.save()
-            return JsonResponse(
-                {
-                    "success": True,
-                    "status": updated_project.get_status_display(),
-                    "status_value": updated_project.status,
-                    "is_overdue": updated_project.is_overdue,
-                }
-            )
-        else:
-            return JsonResponse({"success": False, "errors": form.errors})
-    except Project.DoesNotExist:
+    project = Project.objects.filter(id=project_id, user=request.user).first()
+    if project is None:
         return JsonResponse({"success": False, "error": "Project not found"})
 
+    form = ProjectStatusUpdateForm(request.POST, instance=project, user=request.user)
+
+    if form.is_valid():
+        updated_project = form.save()
+        return JsonResponse(
+            {
+                "success": True,
+                "status": updated_project.get_status_display(),
+                "status_value": updated_project.status,
+                "is_overdue": updated_project.is_overdue,
+            }
+        )
+    else:
+        return JsonResponse({"success": False, "errors": form.errors})
+
 
 @login_required
 @require_POST
@@ -410,92 +470,109 @@ def add_project_note_ajax(request, project_id):
     """
     AJAX добавление заметки к проекту.
     """
-    try:
-        project = Project.objects.get(id=project_id, user=request.user)
-        form = ProjectNoteForm(request.POST, project=project, user=request.user)
-
-        if form.is_valid():
-            note = form.save()
-            return JsonResponse(
-                {
-                    "success": True,
-                    "note": {
-                        "id": str(note.id),
-                        "title": note.title,
-                        "content": (
-                            note.content[:100] + "..."
-                            if len(note.content) > 100
-                            else note.content
-                        ),
-                        "note_type": note.get_note_type_display(),
-                        "is_important": note.is_important,
-                        "is_private": note.is_private,
-                        "created_at": note.created_at.strftime("%d.%m.%Y %H:%M"),
-                        "user": note.user.get_full_name() or note.user.username,
-                    },
-                }
-            )
-        else:
-            return JsonResponse({"success": False, "errors": form.errors})
-    except Project.DoesNotExist:
+    # Проект нужен только для проверки владельца и связи заметки по id
+    project = (
+        Project.objects.filter(id=project_id, user=request.user).only("id").first()
+    )
+    if project is None:
         return JsonResponse({"success": False, "error": "Project not found"})
 
+    form = ProjectNoteForm(request.POST, project=project, user=request.user)
+
+    if form.is_valid():
+        note = form.save()
+        return JsonResponse(
+            {
+                "success": True,
+                "note": {
+                    "id": str(note.id),
+                    "title": note.title,
+                    "content": (
+                        note.content[:100] + "..."
+                        if len(note.content) > 100
+                        else note.content
+                    ),
+                    "note_type": note.get_note_type_display(),
+                    "is_important": note.is_important,
+                    "is_private": note.is_private,
+                    "created_at": note.created_at.strftime("%d.%m.%Y %H:%M"),
+                    "user": note.user.get_full_name() or note.user.username,
+                },
+            }
+        )
+    else:
+        return JsonResponse({"success": False, "errors": form.errors})
+
 
 @login_required
 def get_project_emails_ajax(request, project_id):
     """
     AJAX получение email переписки проекта.
     """
-    try:
-        project = Project.objects.get(id=project_id, user=request.user)
-
-        # Применяем фильтры
-        emails = project.emails.all().order_by("-received_at")
-
-        sender = request.GET.get("sender", "")
-        if sender:
-            emails = emails.filter(sender__icontains=sender)
-
-        date_from = request.GET.get("date_from", "")
-        if date_from:
-            emails = emails.filter(received_at__date__gte=date_from)
+    # Проект нужен только для проверки владельца и связи по id
+    project = (
+        Project.objects.filter(id=project_id, user=request.user).only("id").first()
+    )
+    if project is None:
+        return JsonResponse({"success": False, "error": "Project not found"})
 
-        date_to = request.GET.get("date_to", "")
-        if date_to:
-            emails = emails.filter(received_at__date__lte=date_to)
+    # Применяем фильтры
+    emails = project.emails.filter(
+        project_email_filters(
+            sender=request.GET.get("sender", ""),
+            date_from=request.GET.get("date_from", ""),
+            date_to=request.GET.get("date_to", ""),
+            has_attachments=bool(request.GET.get("has_attachments")),
+            search_body=request.GET.get("search_body", ""),
+        )
+    ).order_by("-received_at")
+
+    # Превью обрезается в БД: полные тела писем не передаются. Лишний
+    # 201-й символ показывает, что текст длиннее превью
+    emails = emails.annotate(body_preview=Substr("body", 1, 201)).values(
+        "id",
+        "subject",
+        "sender",
+        "recipients",
+        "received_at",
+        "has_attachments",
+        "attachments_count",
+        "body_preview",
+    )
+    emails = emails[:100]  # Ограничение для производительности
 
-        if request.GET.get("has_attachments"):
-            emails = emails.filter(has_attachments=True)
+    data = [
+        {
+            "id": str(email["id"]),
+            "subject": email["subject"],
+            "sender": email["sender"],
+            "recipients": email["recipients"] or [],
+            "received_at": email["received_at"].strftime("%d.%m.%Y %H:%M"),
+            "has_attachments": email["has_attachments"],
+            "attachments_count": email["attachments_count"],
+            "body_preview": (
+                email["body_preview"][:200] + "..."
+                if len(email["body_preview"]) > 200
+                else email["body_preview"]
+            ),
+        }
+        for email in emails
+    ]
 
-        search_body = request.GET.get("search_body", "")
-        if search_body:
-            emails = emails.filter(body__icontains=search_body)
+    return JsonResponse({"emails": data})
 
-        emails = emails[:100]  # Ограничение для производительности
 
-        data = [
-            {
-                "id": str(email.id),
-                "subject": email.subject,
-                "sender": email.sender,
-                "recipients": email.recipients_list,
-                "received_at": email.received_at.strftime("%d.%m.%Y %H:%M"),
-                "has_attachments": email.has_attachments,
-                "attachments_count": email.attachments_count,
-                "body_preview": (
-                    email.body[:200] + "..." if len(email.body) > 200 else email.body
-                ),
-            }
-            for email in emails
-        ]
-
-        return JsonResponse({"emails": data})
+# API Views
 
-    except Project.DoesNotExist:
-        return JsonResponse({"success": False, "error": "Project not found"})
 
+class ProjectAPIPagination(PageNumberPagination):
+    """
+    Постраничная выдача проектов в API.
+    """
 
-# API Views
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
 
 
 class ProjectAPIView(APIView):
@@ -505,48 +582,77 @@ class ProjectAPIView(APIView):
 
     permission_classes = [IsAuthenticated, RBACPermission]
     required_permissions = ["view_project"]
+    pagination_class = ProjectAPIPagination
 
     def get(self, request):
         """Получить список проектов пользователя."""
-        projects = Project.objects.filter(
-            user=request.user, is_active=True
-        ).select_related("company", "contact")
+        rows = (
+            Project.objects.filter(user=request.user, is_active=True)
+            .with_overdue()
+            .annotate(emails_count=Count("emails"))
+            .order_by("-created_at")
+            .values(
+                "id",
+                "title",
+                "description",
+                "status",
+                "priority",
+                "inn",
+                "project_number",
+                "deadline",
+                "deadline_overdue",
+                "emails_count",
+                "created_at",
+                "company_id",
+                "company__name",
+                "company__inn",
+                "contact_id",
+                "contact__first_name",
+                "contact__last_name",
+                "contact__email",
+            )
+        )
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(rows, request, view=self)
         data = [
             {
-                "id": str(project.id),
-                "title": project.title,
-                "description": project.description,
-                "status": project.status,
-                "priority": project.priority,
+                "id": str(row["id"]),
+                "title": row["title"],
+                "description": row["description"],
+                "status": row["status"],
+                "priority": row["priority"],
                 "company": (
                     {
-                        "id": str(project.company.id),
-                        "name": project.company.name,
-                        "inn": project.company.inn,
+                        "id": str(row["company_id"]),
+                        "name": row["company__name"],
+                        "inn": row["company__inn"],
                     }
-                    if project.company
+                    if row["company_id"]
                     else None
                 ),
                 "contact": (
                     {
-                        "id": str(project.contact.id),
-                        "name": project.contact.full_name,
-                        "email": project.contact.email,
+                        "id": str(row["contact_id"]),
+                        "name": f"{row['contact__first_name']} "
+                        f"{row['contact__last_name']}".strip(),
+                        "email": row["contact__email"],
                     }
-                    if project.contact
+                    if row["contact_id"]
                     else None
                 ),
-                "inn": project.inn,
-                "project_number": project.project_number,
-                "deadline": project.deadline.isoformat() if project.deadline else None,
-                "is_overdue": project.is_overdue,
-                "progress_percentage": project.progress_percentage,
-                "created_at": project.created_at.isoformat(),
+                "inn": row["inn"],
+                "project_number": row["project_number"],
+                "deadline": row["deadline"].isoformat() if row["deadline"] else None,
+                "is_overdue": row["deadline_overdue"],
+                "progress_percentage": Project.calculate_progress(
+                    row["status"], row["emails_count"]
+                ),
+                "created_at": row["created_at"].isoformat(),
             }
-            for project in projects
+            for row in page
         ]
 
-        return Response(data)
+        return paginator.get_paginated_response(data)
 
     def post(self, request):
         """Создать новый проект."""
@@ -559,6 +665,29 @@ class ProjectAPIView(APIView):
         project_data["user"] = request.user.id
 
         try:
+            # Компания и контакт пользователя проверяются до создания: проект
+            # записывается одним INSERT сразу с FK (чужие/несуществующие id
+            # по-прежнему игнорируются)
+            company_id = None
+            if project_data.get("company_id"):
+                company_id = (
+                    Company.objects.filter(
+                        id=project_data["company_id"], user=request.user
+                    )
+                    .values_list("id", flat=True)
+                    .first()
+                )
+
+            contact_id = None
+            if project_data.get("contact_id"):
+                contact_id = (
+                    Contact.objects.filter(
+                        id=project_data["contact_id"], user=request.user
+                    )
+                    .values_list("id", flat=True)
+                    .first()
+                )
+
             project = Project.objects.create(
                 user=request.user,
                 title=project_data["title"],
@@ -568,33 +697,10 @@ class ProjectAPIView(APIView):
                 inn=project_data.get("inn"),
                 project_number=project_data.get("project_number"),
                 tags=project_data.get("tags", []),
+                company_id=company_id,
+                contact_id=contact_id,
             )
 
-            # Связываем с компанией и контактом если указаны
-            if project_data.get("company_id"):
-                from companies.models import Company
-
-                try:
-                    company = Company.objects.get(
-                        id=project_data["company_id"], user=request.user
-                    )
-                    project.company = company
-                    project.save()
-                except Company.DoesNotExist:
-                    pass
-
-            if project_data.get("contact_id"):
-                from contacts.models import Contact
-
-                try:
-                    contact = Contact.objects.get(
-                        id=project_data["contact_id"], user=request.user
-                    )
-                    project.contact = contact
-                    project.save()
-                except Contact.DoesNotExist:
-                    pass
-
             return Response(
                 {"id": str(project.id), "message": "Проект создан"},
                 status=status.HTTP_201_CREATED,
@@ -614,55 +720,56 @@ class ProjectDetailAPIView(APIView):
 
     def get(self, request, project_id):
         """Получить детальную информацию о проекте."""
-        try:
-            project = Project.objects.get(
-                id=project_id, user=request.user, is_active=True
-            )
-
-            data = {
-                "id": str(project.id),
-                "title": project.title,
-                "description": project.description,
-                "status": project.status,
-                "priority": project.priority,
-                "company": (
-                    {
-                        "id": str(project.company.id),
-                        "name": project.company.name,
-                        "inn": project.company.inn,
-                    }
-                    if project.company
-                    else None
-                ),
-                "contact": (
-                    {
-                        "id": str(project.contact.id),
-                        "name": project.contact.full_name,
-                        "email": project.contact.email,
-                    }
-                    if project.contact
-                    else None
-                ),
-                "inn": project.inn,
-                "project_number": project.project_number,
-                "deadline": project.deadline.isoformat() if project.deadline else None,
-                "is_overdue": project.is_overdue,
-                "progress_percentage": project.progress_percentage,
-                "tags": project.tags,
-                "notes": project.notes,
-                "emails_count": project.emails.count(),
-                "notes_count": project.project_notes.count(),
-                "created_at": project.created_at.isoformat(),
-                "updated_at": project.updated_at.isoformat(),
-            }
-
-            return Response(data)
-
-        except Project.DoesNotExist:
+        project = (
+            Project.objects.with_related()
+            .annotate(emails_count=Count("emails"))
+            .filter(id=project_id, user=request.user, is_active=True)
+            .first()
+        )
+        if project is None:
             return Response(
                 {"error": "Проект не найден"}, status=status.HTTP_404_NOT_FOUND
             )
 
+        data = {
+            "id": str(project.id),
+            "title": project.title,
+            "description": project.description,
+            "status": project.status,
+            "priority": project.priority,
+            "company": (
+                {
+                    "id": str(project.company.id),
+                    "name": project.company.name,
+                    "inn": project.company.inn,
+                }
+                if project.company
+                else None
+            ),
+            "contact": (
+                {
+                    "id": str(project.contact.id),
+                    "name": project.contact.full_name,
+                    "email": project.contact.email,
+                }
+                if project.contact
+                else None
+            ),
+            "inn": project.inn,
+            "project_number": project.project_number,
+            "deadline": project.deadline.isoformat() if project.deadline else None,
+            "is_overdue": project.is_overdue,
+            "progress_percentage": project.progress_percentage,
+            "tags": project.tags,
+            "notes": project.notes,
+            "emails_count": project.emails_count,
+            "notes_count": project.project_notes.count(),
+            "created_at": project.created_at.isoformat(),
+            "updated_at": project.updated_at.isoformat(),
+        }
+
+        return Response(data)
+
     def put(self, request, project_id):
         """Обновить проект."""
         if not check_user_permission(request.user, "change_project"):
@@ -670,34 +777,32 @@ class ProjectDetailAPIView(APIView):
                 {"error": "Недостаточно прав доступа"}, status=status.HTTP_403_FORBIDDEN
             )
 
-        try:
-            project = Project.objects.get(
-                id=project_id, user=request.user, is_active=True
+        project = Project.objects.filter(
+            id=project_id, user=request.user, is_active=True
+        ).first()
+        if project is None:
+            return Response(
+                {"error": "Проект не найден"}, status=status.HTTP_404_NOT_FOUND
             )
 
-            # Обновление полей
-            for field in [
-                "title",
-                "description",
-                "status",
-                "priority",
-                "inn",
-                "project_number",
-                "deadline",
-                "tags",
-                "notes",
-            ]:
-                if field in request.data:
-                    setattr(project, field, request.data[field])
-
-            project.save()
+        # Обновление полей
+        for field in [
+            "title",
+            "description",
+            "status",
+            "priority",
+            "inn",
+            "project_number",
+            "deadline",
+            "tags",
+            "notes",
+        ]:
+            if field in request.data:
+                setattr(project, field, request.data[field])
 
-            return Response({"message": "Проект обновлен"})
+        project.save()
 
-        except Project.DoesNotExist:
-            return Response(
-                {"error": "Проект не найден"}, status=status.HTTP_404_NOT_FOUND
-            )
+        return Response({"message": "Проект обновлен"})
 
     def delete(self, request, project_id):
         """Удалить проект (мягкое удаление)."""
@@ -706,16 +811,18 @@ class ProjectDetailAPIView(APIView):
                 {"error": "Недостаточно прав доступа"}, status=status.HTTP_403_FORBIDDEN
             )
 
-        try:
-            project = Project.objects.get(
-                id=project_id, user=request.user, is_active=True
-            )
-            project.is_active = False
-            project.save()
-
-            return Response({"message": "Проект удален"})
-
-        except Project.DoesNotExist:
+        # Для мягкого удаления нужен только флаг активности
+        project = (
+            Project.objects.filter(id=project_id, user=request.user, is_active=True)
+            .only("id", "user", "is_active", "updated_at")
+            .first()
+        )
+        if project is None:
             return Response(
                 {"error": "Проект не найден"}, status=status.HTTP_404_NOT_FOUND
             )
+
+        project.is_active = False
+        project.save(update_fields=["is_active", "updated_at"])
+
+        return Response({"message": "Проект удален"})
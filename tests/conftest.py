@@ -36,51 +36,100 @@ if not settings.configured:
     )
     django.setup()
 
+import copy
+
 import pytest  # type: ignore
-from django.contrib.auth import get_user_model
-from django.test import Client
-from rest_framework.test import APIClient
-from model_bakery import baker
 
-from users.models import Role, Permission, UserRole, RolePermission, AccessToken
-from contacts.models import Contact
-from companies.models import Company, Order, Payment
-from projects.models import Project
-from emails.models import EmailCredentials, EmailMessage
+# Database-backed fixtures request pytest-django's ``db`` fixture: each test
+# runs inside Django's TestCase transaction and is rolled back to a savepoint,
+# so the schema and the session-scoped rows below are reused across tests.
+
+# Models, DRF and model_bakery are imported inside the fixtures that use
+# them, so collecting tests that need none of them stays cheap.
 
-User = get_user_model()
+# The clients stay function-scoped. A session-wide client would need its
+# auth, credentials and cookies reset after every test, and the public reset
+# (force_authenticate(user=None), i.e. logout()) flushes the session store,
+# so it needs database access in the teardown of DB-free tests too. A fresh
+# Client/APIClient costs next to nothing.
 
 
 @pytest.fixture
 def client():
     """Django test client."""
+    from django.test import Client
+
     return Client()
 
 
 @pytest.fixture
 def api_client():
     """DRF API client."""
+    from rest_framework.test import APIClient
+
     return APIClient()
 
 
+# The default user and its email credentials are inserted once per session,
+# like TestCase.setUpTestData: each test gets a deep copy of the instance and
+# its own DB changes are rolled back to the savepoint of the ``db`` fixture.
+
+
+@pytest.fixture(scope="session")
+def _shared_user(django_db_setup, django_db_blocker):
+    """Create the default test user once per session."""
+    from django.contrib.auth import get_user_model
+    from model_bakery import baker
+
+    with django_db_blocker.unblock():
+        user = baker.make(
+            get_user_model(), email="shared@example.com", username="shareduser"
+        )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
 @pytest.fixture
-def user():
-    """Create a test user."""
-    return baker.make(User, email="test@example.com", username="testuser")
+def user(db, _shared_user):
+    """Test user (per-test copy of the shared user)."""
+    from django.core.cache import cache
+
+    # Per-user cached stats/search results outlive the rolled-back rows
+    cache.clear()
+    return copy.deepcopy(_shared_user)
 
 
 @pytest.fixture
-def admin_user():
-    """Create an admin user."""
-    return baker.make(
-        User,
-        email="admin@example.com",
-        username="admin",
-        is_staff=True,
-        is_superuser=True,
+def unsaved_user():
+    """Build a user in memory only, for model tests that need no database."""
+    from django.contrib.auth import get_user_model
+    from model_bakery import baker
+
+    return baker.prepare(
+        get_user_model(), email="test@example.com", username="testuser"
     )
 
 
+@pytest.fixture(scope="session")
+def admin_user(django_db_setup, django_db_blocker):
+    """Create an admin user once per session (read-only in tests)."""
+    from django.contrib.auth import get_user_model
+    from model_bakery import baker
+
+    with django_db_blocker.unblock():
+        admin = baker.make(
+            get_user_model(),
+            email="admin@example.com",
+            username="admin",
+            is_staff=True,
+            is_superuser=True,
+        )
+    yield admin
+    with django_db_blocker.unblock():
+        admin.delete()
+
+
 @pytest.fixture
 def authenticated_client(api_client, user):
     """API client authenticated as regular user."""
@@ -89,81 +138,142 @@ def authenticated_client(api_client, user):
 
 
 @pytest.fixture
-def admin_client(api_client, admin_user):
+def admin_client(db, api_client, admin_user):
     """API client authenticated as admin user."""
     api_client.force_authenticate(user=admin_user)
     return api_client
 
 
-@pytest.fixture
-def role():
-    """Create a test role."""
-    return baker.make(Role, name="Test Role", description="Test role description")
+# Tests only read the reference roles/permissions, so they are created once
+# per session outside the per-test transaction and removed at the end. Names
+# differ from the ones tests create themselves (name/codename are unique).
 
 
-@pytest.fixture
-def permission():
-    """Create a test permission."""
-    return baker.make(Permission, name="Test Permission", codename="test_perm")
+@pytest.fixture(scope="session")
+def role(django_db_setup, django_db_blocker):
+    """Create a shared test role."""
+    from users.models import Role
+
+    with django_db_blocker.unblock():
+        role = Role.objects.create(
+            name="Shared Test Role", description="Test role description"
+        )
+    yield role
+    with django_db_blocker.unblock():
+        role.delete()
+
+
+@pytest.fixture(scope="session")
+def permission(django_db_setup, django_db_blocker):
+    """Create a shared test permission."""
+    from users.models import Permission
+
+    with django_db_blocker.unblock():
+        permission = Permission.objects.create(
+            name="Shared Test Permission", codename="shared_test_perm"
+        )
+    yield permission
+    with django_db_blocker.unblock():
+        permission.delete()
 
 
 @pytest.fixture
 def user_role(user, role):
     """Create a user-role relationship."""
-    return baker.make(UserRole, user=user, role=role)
+    from users.models import UserRole
+
+    return UserRole.objects.create(user=user, role=role)
 
 
 @pytest.fixture
 def role_permission(role, permission):
     """Create a role-permission relationship."""
-    return baker.make(RolePermission, role=role, permission=permission)
+    from users.models import RolePermission
+
+    return RolePermission.objects.create(role=role, permission=permission)
 
 
 @pytest.fixture
 def access_token(user):
     """Create an access token for user."""
+    from model_bakery import baker
+    from users.models import AccessToken
+
     return baker.make(AccessToken, user=user, is_active=True)
 
 
 @pytest.fixture
 def contact(user):
     """Create a test contact."""
+    from model_bakery import baker
+    from contacts.models import Contact
+
     return baker.make(Contact, user=user)
 
 
 @pytest.fixture
 def company(user):
     """Create a test company."""
+    from model_bakery import baker
+    from companies.models import Company
+
     return baker.make(Company, user=user, inn="1234567890")
 
 
 @pytest.fixture
 def order(company):
     """Create a test order."""
+    from model_bakery import baker
+    from companies.models import Order
+
     return baker.make(Order, company=company)
 
 
 @pytest.fixture
 def payment(company, order):
     """Create a test payment."""
+    from model_bakery import baker
+    from companies.models import Payment
+
     return baker.make(Payment, company=company, order=order)
 
 
 @pytest.fixture
 def project(user, company):
     """Create a test project."""
+    from model_bakery import baker
+    from projects.models import Project
+
     return baker.make(Project, user=user, inn=company.inn if company else None)
 
 
+@pytest.fixture(scope="session")
+def _shared_email_credentials(_shared_user, django_db_blocker):
+    """Create email credentials for the shared user once per session."""
+    from model_bakery import baker
+    from emails.models import EmailCredentials
+
+    with django_db_blocker.unblock():
+        credentials = baker.make(EmailCredentials, user=_shared_user, is_active=True)
+    yield credentials
+    with django_db_blocker.unblock():
+        credentials.delete()
+
+
 @pytest.fixture
-def email_credentials(user):
-    """Create email credentials."""
-    return baker.make(EmailCredentials, user=user, is_active=True)
+def email_credentials(user, _shared_email_credentials):
+    """Email credentials (per-test copy of the shared ones)."""
+    credentials = copy.deepcopy(_shared_email_credentials)
+    credentials.user = user
+    return credentials
 
 
 @pytest.fixture
 def email_message(user, email_credentials, project, company):
     """Create a test email message."""
+    from model_bakery import baker
+    from emails.models import EmailMessage
+
     return baker.make(
         EmailMessage,
         user=user,
@@ -173,31 +283,54 @@ def email_message(user, email_credentials, project, company):
     )
 
 
-@pytest.fixture
-def system_roles():
+@pytest.fixture(scope="session")
+def system_roles(django_db_setup, django_db_blocker):
     """Create system roles (Admin, Manager, User)."""
-    admin_role = baker.make(
-        Role,
+    from users.models import Role
+
+    with django_db_blocker.unblock():
+        roles = _make_system_roles()
+    yield roles
+    with django_db_blocker.unblock():
+        Role.objects.filter(pk__in=[r.pk for r in roles.values()]).delete()
+
+
+def _make_system_roles():
+    """Create the Admin/Manager/User system roles."""
+    from users.models import Role
+
+    admin_role = Role.objects.create(
         name="Администратор",
         description="Полный доступ ко всем функциям",
         is_system_role=True,
     )
-    manager_role = baker.make(
-        Role,
+    manager_role = Role.objects.create(
         name="Менеджер",
         description="Управление проектами и контактами",
         is_system_role=True,
     )
-    user_role = baker.make(
-        Role, name="Пользователь", description="Базовый доступ", is_system_role=True
+    user_role = Role.objects.create(
+        name="Пользователь", description="Базовый доступ", is_system_role=True
     )
     return {"admin": admin_role, "manager": manager_role, "user": user_role}
 
 
-@pytest.fixture
-def system_permissions():
+@pytest.fixture(scope="session")
+def system_permissions(django_db_setup, django_db_blocker):
     """Create system permissions."""
-    permissions = {}
+    from users.models import Permission
+
+    with django_db_blocker.unblock():
+        permissions = _make_system_permissions()
+    yield permissions
+    with django_db_blocker.unblock():
+        Permission.objects.filter(pk__in=[p.pk for p in permissions.values()]).delete()
+
+
+def _make_system_permissions():
+    """Create the system permissions keyed by codename."""
+    from users.models import Permission
+
     permission_data = [
         ("view_users", "Просмотр пользователей"),
         ("add_users", "Создание пользователей"),
@@ -211,9 +344,9 @@ def system_permissions():
         ("manage_permissions", "Управление разрешениями"),
     ]
 
-    for codename, name in permission_data:
-        permissions[codename] = baker.make(
-            Permission, name=name, codename=codename, is_system_permission=True
-        )
-
-    return permissions
+    # One INSERT; primary keys are generated client-side (uuid7)
+    permissions = Permission.objects.bulk_create(
+        Permission(name=name, codename=codename, is_system_permission=True)
+        for codename, name in permission_data
+    )
+    return {permission.codename: permission for permission in permissions}
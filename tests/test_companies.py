@@ -6,51 +6,59 @@ from model_bakery import baker
 from companies.models import Company, Order, Payment
 
 
+# Model tests only inspect Python attributes, so instances are built
+# unsaved and the tests run without database access.
+
+
 class TestCompanyModel:
     """Test Company model functionality."""
 
-    def test_company_creation(self, user):
+    def test_company_creation(self, unsaved_user):
         """Test basic company creation."""
-        company = baker.make(Company, user=user, name="Test Company", inn="1234567890")
+        company = Company(user=unsaved_user, name="Test Company", inn="1234567890")
         assert company.name == "Test Company"
         assert company.inn == "1234567890"
-        assert company.user == user
+        assert company.user == unsaved_user
 
-    def test_company_str(self, user):
+    def test_company_str(self, unsaved_user):
         """Test company string representation."""
-        company = baker.make(Company, user=user, name="ABC Corp")
+        company = Company(user=unsaved_user, name="ABC Corp")
         assert str(company) == "ABC Corp"
 
 
 class TestOrderModel:
     """Test Order model functionality."""
 
-    def test_order_creation(self, company):
+    def test_order_creation(self, unsaved_user):
         """Test basic order creation."""
-        order = baker.make(Order, company=company, number="ORD-001", amount=100000)
+        company = Company(user=unsaved_user, inn="1234567890")
+        order = Order(company=company, number="ORD-001", amount=100000)
         assert order.number == "ORD-001"
         assert order.amount == 100000
         assert order.company == company
 
-    def test_order_str(self, company):
+    def test_order_str(self, unsaved_user):
         """Test order string representation."""
-        order = baker.make(Order, company=company, number="ORD-002")
+        order = Order(company=Company(user=unsaved_user), number="ORD-002")
         assert str(order) == "ORD-002"
 
 
 class TestPaymentModel:
     """Test Payment model functionality."""
 
-    def test_payment_creation(self, company, order):
+    def test_payment_creation(self, unsaved_user):
         """Test basic payment creation."""
-        payment = baker.make(Payment, company=company, order=order, amount=50000)
+        company = Company(user=unsaved_user, inn="1234567890")
+        order = Order(company=company)
+        payment = Payment(company=company, order=order, amount=50000)
         assert payment.amount == 50000
         assert payment.company == company
         assert payment.order == order
 
-    def test_payment_str(self, company, order):
+    def test_payment_str(self, unsaved_user):
         """Test payment string representation."""
-        payment = baker.make(Payment, company=company, order=order, amount=75000)
+        company = Company(user=unsaved_user)
+        payment = Payment(company=company, order=Order(company=company), amount=75000)
         assert str(payment) == f"Payment {payment.id}"
 
 
@@ -294,9 +302,15 @@ class TestFinancialCalculations:
 
     def test_company_balance_calculation(self, authenticated_client, company):
         """Test company balance calculation."""
-        # Create multiple orders and payments
-        order1 = baker.make(Order, company=company, amount=100000)
-        order2 = baker.make(Order, company=company, amount=50000)
+        # Create multiple orders (one INSERT) and payments; payments go through
+        # save() since it updates the company debt
+        order1, order2 = baker.make(
+            Order,
+            company=company,
+            amount=iter([100000, 50000]),
+            _quantity=2,
+            _bulk_create=True,
+        )
         payment1 = baker.make(Payment, company=company, order=order1, amount=60000)
         payment2 = baker.make(Payment, company=company, order=order2, amount=30000)
 
@@ -1,9 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 import pytest
+from django.core.paginator import EmptyPage
 from django.urls import reverse
 from rest_framework import status
 from model_bakery import baker
 
 from emails.models import EmailCredentials, EmailMessage, EmailSyncLog
+from emails.utils import EmailParser, EmailProcessor
+from emails.views import CappedCountPaginator
+from projects.models import Project, ProjectAttachment, ProjectEmail
 
 
 class TestEmailCredentialsModel:
@@ -100,6 +107,119 @@ class TestEmailViews:
         response = authenticated_client.get(reverse("emails:credentials_setup"))
         assert response.status_code == 200
 
+    def test_bulk_mark_read(self, authenticated_client, user, email_credentials):
+        """Test marking several emails as read in one request."""
+        emails = baker.make(
+            EmailMessage,
+            user=user,
+            credentials=email_credentials,
+            is_read=False,
+            _quantity=3,
+        )
+        response = authenticated_client.post(
+            reverse("emails:bulk_mark_read_ajax"),
+            {"ids": [str(email.id) for email in emails[:2]]},
+            format="json",
+        )
+        assert response.status_code == 200
+        assert response.json()["updated"] == 2
+        assert EmailMessage.objects.filter(user=user, is_read=True).count() == 2
+
+    def test_relink_email_moves_project_email(self, client, user, email_credentials):
+        """Test that re-linking an email moves its project history record."""
+        client.force_login(user)
+        first, second = baker.make(Project, user=user, _quantity=2)
+        email = baker.make(EmailMessage, user=user, credentials=email_credentials)
+
+        for project in (first, second):
+            response = client.post(
+                reverse(
+                    "emails:link_email_to_project_ajax",
+                    kwargs={"email_id": email.id, "project_id": project.id},
+                )
+            )
+            assert response.json()["success"]
+
+        email.refresh_from_db()
+        assert email.related_project == second
+        assert list(
+            ProjectEmail.objects.filter(message_id=email.message_id).values_list(
+                "project_id", flat=True
+            )
+        ) == [second.id]
+
+    def test_relink_email_keeps_attachments(self, client, user, email_credentials):
+        """Test that attachments of the project email survive a re-link."""
+        client.force_login(user)
+        first, second = baker.make(Project, user=user, _quantity=2)
+        email = baker.make(EmailMessage, user=user, credentials=email_credentials)
+        project_email = baker.make(
+            ProjectEmail, project=first, message_id=email.message_id
+        )
+        attachment = baker.make(ProjectAttachment, project_email=project_email)
+
+        response = client.post(
+            reverse(
+                "emails:link_email_to_project_ajax",
+                kwargs={"email_id": email.id, "project_id": second.id},
+            )
+        )
+        assert response.json()["success"]
+
+        project_email.refresh_from_db()
+        assert project_email.project == second
+        assert ProjectAttachment.objects.filter(
+            pk=attachment.pk, project_email=project_email
+        ).exists()
+
+    def test_link_already_linked_email_creates_project_email(
+        self, client, user, email_credentials
+    ):
+        """Test that linking an email already pointing at the project adds its record."""
+        client.force_login(user)
+        project = baker.make(Project, user=user)
+        email = baker.make(
+            EmailMessage,
+            user=user,
+            credentials=email_credentials,
+            related_project=project,
+        )
+
+        response = client.post(
+            reverse(
+                "emails:link_email_to_project_ajax",
+                kwargs={"email_id": email.id, "project_id": project.id},
+            )
+        )
+        assert response.json()["success"]
+        assert ProjectEmail.objects.filter(
+            project=project, message_id=email.message_id
+        ).exists()
+
+    def test_capped_paginator_pages_past_cap(self, user, email_credentials):
+        """Test that pages beyond the capped count stay reachable."""
+        baker.make(EmailMessage, user=user, credentials=email_credentials, _quantity=7)
+        paginator = CappedCountPaginator(
+            EmailMessage.objects.filter(user=user).order_by("pk"), 2
+        )
+        paginator.max_count = 4
+
+        assert paginator.count == 4
+        assert paginator.count_capped
+        assert paginator.num_pages == 2
+
+        page = paginator.page(3)
+        assert len(page) == 2
+        assert page.has_next()
+
+        last_page = paginator.page(4)
+        assert len(last_page) == 1
+        assert not last_page.has_next()
+        assert last_page.end_index() == 7
+
+        with pytest.raises(EmptyPage):
+            paginator.page(5)
+
 
 class TestEmailAPIViews:
     """Test email API views."""
@@ -282,6 +402,20 @@ class TestEmailProcessing:
         if "parsed_inn" in response.data:
             assert response.data["parsed_inn"] == inn
 
+    @pytest.mark.parametrize(
+        "text", ["Заказ7707083893", "тел.7707083893руб", "№7707083893от"]
+    )
+    def test_inn_not_parsed_from_digits_glued_to_cyrillic(self, text):
+        """Test that digits glued to Cyrillic letters are not taken as an INN."""
+        assert EmailParser().extract_inn(text) is None
+
+    @pytest.mark.parametrize(
+        "text", ["ИНН\u00a07707083893", "ИНН ОРГАНИЗАЦИИ: 7707083893"]
+    )
+    def test_inn_parsed_after_keyword(self, text):
+        """Test INN parsing after a keyword separated by NBSP or in upper case."""
+        assert EmailParser().extract_inn(text) == "7707083893"
+
     def test_project_creation_from_email(self, authenticated_client, email_credentials):
         """Test automatic project creation from email."""
         inn = "1234567890"
@@ -417,3 +551,60 @@ class TestEmailStatistics:
         assert "successful_syncs" in stats
         assert "total_messages_processed" in stats
         assert stats["total_messages_processed"] >= 15
+
+
+class TestEmailProcessorBatch:
+    """Test batch parsing of email messages."""
+
+    def test_process_batch_isolates_bad_message(self, db):
+        """A message that fails to parse does not lose the rest of the batch."""
+        good = EmailMessage(
+            subject="Проект PR-001",
+            body_text="ИНН 7707083893",
+            body_html="",
+        )
+        # Non-string subject makes the regex scan raise TypeError
+        bad = EmailMessage(subject=12345, body_text="", body_html="")
+
+        results = EmailProcessor().process_batch([good, bad, good], max_workers=2)
+
+        assert len(results) == 3
+        for result in (results[0], results[2]):
+            assert result["parsed_inn"] == "7707083893"
+            assert result["parsed_project_number"] == "PR-001"
+            assert result["processing_errors"] == []
+        assert results[1]["processing_errors"]
+        assert results[1]["parsed_inn"] is None
+
+    def test_process_batch_parses_serially_in_daemon_process(self, db):
+        """A daemonic worker cannot fork, so the batch is parsed in-process."""
+        messages = [
+            EmailMessage(
+                subject="Проект PR-001", body_text="ИНН 7707083893", body_html=""
+            )
+            for _ in range(3)
+        ]
+
+        with (
+            mock.patch(
+                "emails.utils.multiprocessing.current_process"
+            ) as current_process,
+            mock.patch("emails.utils.ProcessPoolExecutor") as executor,
+        ):
+            current_process.return_value.daemon = True
+            results = EmailProcessor().process_batch(messages)
+
+        executor.assert_not_called()
+        assert [r["parsed_inn"] for r in results] == ["7707083893"] * 3
+
+    def test_process_batch_suggests_same_project_as_process_email(self, user):
+        """Batch and single-message processing pick the same matching project."""
+        baker.make(Project, user=user, project_number="PR-001", _quantity=2)
+        message = EmailMessage(subject="Проект PR-001", body_text="", body_html="")
+
+        with mock.patch("emails.utils.ProcessPoolExecutor", ThreadPoolExecutor):
+            results = EmailProcessor().process_batch([message, message])
+
+        expected = EmailProcessor().process_email(message)["suggested_project"]
+        assert expected is not None
+        assert [r["suggested_project"] for r in results] == [expected, expected]
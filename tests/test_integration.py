@@ -222,10 +222,10 @@ class TestRBACIntegration:
     def test_user_role_permissions(self, authenticated_client, user, role, permission):
         """Test that user gets permissions through roles."""
         # Assign role to user
-        baker.make(UserRole, user=user, role=role)
+        UserRole.objects.create(user=user, role=role)
 
         # Assign permission to role
-        baker.make(RolePermission, role=role, permission=permission)
+        RolePermission.objects.create(role=role, permission=permission)
 
         # Check if user has permission (this would be checked in business logic)
         user_permissions = set()
@@ -238,26 +238,28 @@ class TestRBACIntegration:
     def test_role_hierarchy(self, authenticated_client, user):
         """Test role hierarchy and permission inheritance."""
         # Create roles with different permission levels
-        admin_role = baker.make(Role, name="Admin")
-        manager_role = baker.make(Role, name="Manager")
-        user_role = baker.make(Role, name="User")
+        admin_role = Role.objects.create(name="Admin")
+        manager_role = Role.objects.create(name="Manager")
+        user_role = Role.objects.create(name="User")
 
         # Create permissions
-        admin_perm = baker.make(
-            Permission, name="Admin Permission", codename="admin_perm"
+        admin_perm = Permission.objects.create(
+            name="Admin Permission", codename="admin_perm"
         )
-        manager_perm = baker.make(
-            Permission, name="Manager Permission", codename="manager_perm"
+        manager_perm = Permission.objects.create(
+            name="Manager Permission", codename="manager_perm"
+        )
+        user_perm = Permission.objects.create(
+            name="User Permission", codename="user_perm"
         )
-        user_perm = baker.make(Permission, name="User Permission", codename="user_perm")
 
         # Assign permissions to roles
-        baker.make(RolePermission, role=admin_role, permission=admin_perm)
-        baker.make(RolePermission, role=manager_role, permission=manager_perm)
-        baker.make(RolePermission, role=user_role, permission=user_perm)
+        RolePermission.objects.create(role=admin_role, permission=admin_perm)
+        RolePermission.objects.create(role=manager_role, permission=manager_perm)
+        RolePermission.objects.create(role=user_role, permission=user_perm)
 
         # Assign admin role to user
-        baker.make(UserRole, user=user, role=admin_role)
+        UserRole.objects.create(user=user, role=admin_role)
 
         # Check permissions
         user_permissions = set()
@@ -68,6 +68,24 @@ class TestProjectViews:
         )
         assert response.status_code == 200
 
+    def test_project_search_ajax_sees_saved_changes(self, client, user):
+        """Test that cached AJAX search results are dropped on project save/delete."""
+        client.force_login(user)
+        url = reverse("projects:project_search_ajax")
+        project = baker.make(Project, user=user, title="Alpha")
+
+        response = client.get(url)
+        assert [p["title"] for p in response.json()["projects"]] == ["Alpha"]
+
+        project.title = "Beta"
+        project.save()
+        response = client.get(url)
+        assert [p["title"] for p in response.json()["projects"]] == ["Beta"]
+
+        project.delete()
+        response = client.get(url)
+        assert response.json()["projects"] == []
+
 
 class TestProjectAPIViews:
     """Test project API views."""
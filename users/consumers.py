@@ -418,6 +418,20 @@ class ProjectConsumer(AsyncWebsocketConsumer):
             )
         )
 
+    async def emails_linked(self, event):
+        """
+        К проекту привязано несколько email одной пачкой.
+        """
+        await self.send(
+            text_data=json.dumps(
+                {
+                    "type": "emails_linked",
+                    "emails": event["emails"],
+                    "timestamp": event["timestamp"],
+                }
+            )
+        )
+
 
 class EmailConsumer(AsyncWebsocketConsumer):
     """
@@ -1,8 +1,8 @@
-import uuid
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
+from crm.utils import uuid7
 from .managers import UserManager
 
 
@@ -11,7 +11,7 @@ class User(AbstractUser):
     Кастомная модель пользователя с расширенными полями на базе AllAuth.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(_("email address"), unique=True)
     phone = PhoneNumberField(_("phone number"), blank=True, null=True)
     date_of_birth = models.DateField(_("date of birth"), blank=True, null=True)
@@ -61,7 +61,7 @@ class Role(models.Model):
     Модель роли для системы RBAC.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(_("name"), max_length=100, unique=True)
     description = models.TextField(_("description"), blank=True)
     is_system_role = models.BooleanField(_("system role"), default=False)
@@ -82,7 +82,7 @@ class Permission(models.Model):
     Модель разрешения для системы RBAC.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(_("name"), max_length=100, unique=True)
     codename = models.CharField(_("codename"), max_length=100, unique=True)
     description = models.TextField(_("description"), blank=True)
@@ -104,7 +104,7 @@ class UserRole(models.Model):
     Связь между пользователями и ролями.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="user_roles")
     role = models.ForeignKey(Role, on_delete=models.CASCADE, related_name="user_roles")
     assigned_by = models.ForeignKey(
@@ -131,7 +131,7 @@ class RolePermission(models.Model):
     Связь между ролями и разрешениями.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     role = models.ForeignKey(
         Role, on_delete=models.CASCADE, related_name="role_permissions"
     )
@@ -162,7 +162,7 @@ class AccessToken(models.Model):
     Модель токена доступа с ограниченным временем жизни.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="access_tokens"
     )
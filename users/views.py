@@ -27,6 +27,10 @@ from rest_framework.decorators import api_view
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from companies.models import Company
+from contacts.models import Contact
+from emails.models import EmailMessage, EmailSyncLog
+from projects.models import Project
 from .forms import (
     CustomUserCreationForm,
     CustomUserChangeForm,
@@ -60,11 +64,6 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
     def get_dashboard_stats(self):
         """Получить статистику для дашборда."""
-        from emails.models import EmailMessage
-        from projects.models import Project
-        from companies.models import Company
-        from contacts.models import Contact
-
         return {
             "emails_total": EmailMessage.objects.filter(user=self.request.user).count(),
             "emails_unread": EmailMessage.objects.filter(
@@ -88,8 +87,6 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
     def get_recent_emails(self):
         """Получить последние email."""
-        from emails.models import EmailMessage
-
         return (
             EmailMessage.objects.filter(user=self.request.user)
             .select_related("related_company", "related_project")
@@ -98,8 +95,6 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
     def get_recent_projects(self):
         """Получить последние активные проекты."""
-        from projects.models import Project
-
         return Project.objects.filter(user=self.request.user, is_active=True).order_by(
             "-created_at"
         )[:5]
@@ -240,11 +235,6 @@ class DashboardStatsAPIView(APIView):
 
     @staticmethod
     def get(request):
-        from emails.models import EmailMessage
-        from projects.models import Project
-        from companies.models import Company
-        from contacts.models import Contact
-
         stats = {
             "emails_total": EmailMessage.objects.filter(user=request.user).count(),
             "unread_emails": EmailMessage.objects.filter(
@@ -281,8 +271,6 @@ class RecentActivityAPIView(APIView):
         activities = []
 
         # Недавние email
-        from emails.models import EmailMessage
-
         recent_emails = EmailMessage.objects.filter(user=request.user).order_by(
             "-received_at"
         )[:3]
@@ -299,8 +287,6 @@ class RecentActivityAPIView(APIView):
             )
 
         # Недавние проекты
-        from projects.models import Project
-
         recent_projects = Project.objects.filter(user=request.user).order_by(
             "-created_at"
         )[:3]
@@ -349,8 +335,6 @@ class SystemHealthAPIView(APIView):
 
         # Проверка email синхронизации
         try:
-            from emails.models import EmailSyncLog
-
             last_sync = (
                 EmailSyncLog.objects.filter(
                     credentials__user=request.user,